@@ -0,0 +1,57 @@
+"""
+Markdown記事の共通処理
+
+preview_html.py と seo_optimizer.py で共有するfront matterの分離・パース処理です。
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+
+# Front matterと本文を分離するパターン
+FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+
+
+class FrontMatterError(Exception):
+    """Front matterのパースエラー"""
+    pass
+
+
+def split_front_matter(content: str) -> Optional[Tuple[str, str]]:
+    """
+    Markdownをfront matterと本文に分離
+
+    Args:
+        content: Markdownファイルの内容
+
+    Returns:
+        (front matterのYAML文字列, 本文)、front matterがない場合はNone
+    """
+    match = FRONT_MATTER_RE.match(content)
+    if not match:
+        return None
+
+    return match.group(1), match.group(2).strip()
+
+
+def load_front_matter(yaml_text: str) -> Dict:
+    """
+    front matterのYAMLをパース
+
+    Args:
+        yaml_text: front matterのYAML文字列
+
+    Returns:
+        front matter辞書
+
+    Raises:
+        FrontMatterError: YAMLのパースに失敗した場合
+    """
+    # YAMLは必要になった時点で読み込む (libyamlがあればC実装のローダーを使う)
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    try:
+        return yaml.load(yaml_text, Loader=loader)
+    except yaml.YAMLError as e:
+        raise FrontMatterError(str(e))
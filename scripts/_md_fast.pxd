@@ -0,0 +1,15 @@
+# _md_fast.py をCythonでコンパイルする際の型宣言 (純Pythonとして実行する場合は使われない)
+import cython
+
+cdef str _inline_to_html(str text)
+
+@cython.locals(marks=str, tag=str)
+cdef str _heading_to_html(str line)
+
+cdef bint _is_table_line(str line)
+
+cdef void _flush_paragraph(list out, list paragraph)
+
+@cython.locals(lines=list, n=Py_ssize_t, in_list=bint, i=Py_ssize_t,
+               line=str, is_item=bint, end=Py_ssize_t, text=str)
+cdef list _md_tokenize(str markdown_text)
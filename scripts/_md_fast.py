@@ -0,0 +1,178 @@
+"""
+簡易Markdown→HTML変換
+
+serve_preview.py でmistuneがない場合に使う、1行ずつ1回だけ走査する変換処理です。
+Cythonがあれば python scripts/build_md_fast.py でこのファイルをそのままコンパイルでき、
+型宣言は _md_fast.pxd に分けてあります (ビルドしなければ純Pythonとして動作)。
+"""
+
+import re
+from typing import List
+
+try:
+    # RE2はバックトラックしないため、どんな入力でも線形時間でマッチする
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# 簡易Markdown変換用のパターン (リクエストごとに再コンパイルしないようimport時に作成)
+_HEADINGS = (('#### ', 'h4'), ('### ', 'h3'), ('## ', 'h2'))
+_LIST_MARKERS = '-*0123456789'
+_OL_ITEM_RE = _re.compile(r'\d+\. (.+)$')
+_UL_ITEM_RE = _re.compile(r'[\-\*] (.+)$')
+_BOLD_RE = _re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = _re.compile(r'\*(.+?)\*')
+_LINK_RE = _re.compile(r'\[(.+?)\]\((.+?)\)')
+_IMG_RE = _re.compile(r'!\[(.+?)\]\((.+?)\)')
+
+
+def _inline_to_html(text: str) -> str:
+    """太字・斜体・画像・リンクを変換 (記号を含む場合だけ正規表現を実行)"""
+    if '*' in text:
+        if '**' in text:
+            text = _BOLD_RE.sub(r'<strong>\1</strong>', text)
+        if '*' in text:
+            text = _ITALIC_RE.sub(r'<em>\1</em>', text)
+    if '](' in text:
+        if '![' in text:
+            text = _IMG_RE.sub(r'<img src="\2" alt="\1" loading="lazy" />', text)
+        text = _LINK_RE.sub(r'<a href="\2">\1</a>', text)
+    return text
+
+
+def _heading_to_html(line: str) -> str:
+    """見出し行(##〜####)を変換 (見出しでなければそのまま返す)"""
+    if line.startswith('##'):
+        for marks, tag in _HEADINGS:
+            if line.startswith(marks) and len(line) > len(marks):
+                return f'<{tag}>{line[len(marks):]}</{tag}>'
+    return line
+
+
+def _is_table_line(line: str) -> bool:
+    """テーブルの行かどうか"""
+    return '|' in line and not line.strip().startswith('<')
+
+
+def convert_table(lines: List[str]) -> str:
+    """Markdownテーブルを HTMLに変換"""
+    if len(lines) < 2:
+        return '\n'.join(lines)
+
+    parts = ['<table>']
+
+    # ヘッダー
+    header = lines[0].strip('|').split('|')
+    parts.append('<thead><tr>')
+    parts.extend(f'<th>{cell.strip()}</th>' for cell in header)
+    parts.append('</tr></thead>')
+
+    # ボディ（区切り行をスキップ）
+    parts.append('<tbody>')
+    for line in lines[2:]:
+        cells = line.strip('|').split('|')
+        parts.append('<tr>')
+        parts.extend(f'<td>{cell.strip()}</td>' for cell in cells)
+        parts.append('</tr>')
+    parts.append('</tbody>')
+
+    parts.append('</table>')
+    return ''.join(parts)
+
+
+def _flush_paragraph(out: List[str], paragraph: List[str]) -> None:
+    """溜めた段落の行を<p>にまとめてoutに追加"""
+    if paragraph:
+        out.append('<p>' + ' '.join(paragraph) + '</p>')
+        paragraph.clear()
+
+
+def _md_tokenize(markdown_text: str) -> List[str]:
+    """
+    Markdownを1行ずつ1回だけ走査してHTMLの行に変換
+
+    Args:
+        markdown_text: Markdown本文
+
+    Returns:
+        HTMLの行のリスト
+    """
+    lines = markdown_text.split('\n')
+    n = len(lines)
+    out: List[str] = []
+    paragraph: List[str] = []
+    in_list = False
+    i = 0
+
+    while i < n:
+        line = lines[i]
+        i += 1
+        is_item = False
+
+        if line.startswith('```'):
+            # コードブロック (閉じる```までをそのまま出力)
+            end = i
+            while end < n and not lines[end].lstrip().startswith('```'):
+                end += 1
+            if end < n:
+                text = '<pre><code>' + '\n'.join(lines[i:end]) + '</code></pre>'
+                i = end + 1
+                _flush_paragraph(out, paragraph)
+                if in_list:
+                    text = '</ul>' + text
+                    in_list = False
+                out.append(text)
+                continue
+
+        text = _heading_to_html(line)
+
+        # テーブル (簡易対応: |を含む連続した2行以上)
+        end = i
+        if _is_table_line(text):
+            while end < n and _is_table_line(_heading_to_html(lines[end])):
+                end += 1
+
+        if end > i:
+            text = convert_table(lines[i - 1:end])
+            i = end
+        elif text[:1] and text[0] in _LIST_MARKERS:
+            # リスト
+            m = _OL_ITEM_RE.match(text) or _UL_ITEM_RE.match(text)
+            if m:
+                text = f'<li>{m.group(1)}</li>'
+                is_item = True
+
+        if is_item and not in_list:
+            text = '<ul>' + text
+        elif in_list and not is_item:
+            text = '</ul>' + text
+        in_list = is_item
+
+        # 段落
+        text = _inline_to_html(text).strip()
+        if not text:
+            _flush_paragraph(out, paragraph)
+        elif text.startswith('<'):
+            _flush_paragraph(out, paragraph)
+            out.append(text)
+        else:
+            paragraph.append(text)
+
+    _flush_paragraph(out, paragraph)
+    if in_list:
+        out[-1] += '</ul>'
+
+    return out
+
+
+def md_to_html(markdown_text: str) -> str:
+    """
+    簡易Markdown→HTML変換
+
+    Args:
+        markdown_text: Markdown本文
+
+    Returns:
+        HTML文字列
+    """
+    return '\n'.join(_md_tokenize(markdown_text))
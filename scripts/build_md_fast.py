@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Cython版Markdown変換モジュールのビルドスクリプト
+
+scripts/_md_fast.py を (_md_fast.pxd の型宣言付きで) Cythonの純Pythonモードでコンパイルし、
+scripts/ に拡張モジュールを配置します。ソースは1つなので、ビルドの有無で変換結果は変わりません。
+ビルドしなくても serve_preview.py は同じ _md_fast.py をそのまま使って動作します。
+
+使い方:
+    pip install cython
+    python scripts/build_md_fast.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+
+def main() -> int:
+    """メイン処理"""
+    try:
+        from Cython.Build import cythonize
+        from setuptools import Extension, setup
+    except ImportError:
+        print("❌ Cythonがインストールされていません: pip install cython", file=sys.stderr)
+        return 1
+
+    # 拡張モジュールを scripts/ に直接配置するため、scripts/ でビルドする
+    os.chdir(Path(__file__).parent)
+
+    setup(
+        name='_md_fast',
+        ext_modules=cythonize(
+            [Extension('_md_fast', ['_md_fast.py'])],
+            # 型は _md_fast.pxd で宣言するため、typing の注釈 (List[str] など) は型として解釈させない
+            compiler_directives={'language_level': 3, 'annotation_typing': False},
+        ),
+        script_args=['build_ext', '--inplace'],
+    )
+
+    print("✅ _md_fast をビルドしました")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,21 +4,44 @@
 
 使い方:
     python scripts/generate_article.py --type review --app Tinder
+
+    # 複数アプリの記事を並列生成
+    python scripts/generate_article.py --type review --apps Tinder,Pairs,Omiai
 """
 
 import argparse
+import asyncio
 import csv
+import functools
 import json
 import os
+import re
 import sys
+from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from dotenv import load_dotenv
 
 
+# テンプレート変数 ({app_name} など) のパターン
+_VAR_RE = re.compile(r'\{([a-z_]+)\}')
+
+# アプリ名をスラッグに変換するテーブル (スペース -> ハイフン)
+_SLUG_TR = str.maketrans({' ': '-'})
+
+# 記事ファイル書き込み時のバッファサイズ
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# バッチ生成時のAPI同時リクエスト数の上限
+_MAX_CONCURRENCY = 4
+
+# プロセス内で使い回すClaude APIクライアント
+_client: Optional[Anthropic] = None
+
+
 class ArticleGenerationError(Exception):
     """記事生成エラー"""
     pass
@@ -56,45 +79,92 @@ def get_api_key() -> str:
     return api_key
 
 
+def slugify_app_name(app_name: str) -> str:
+    """アプリ名からURL・ファイル名用のスラッグを生成 (例: 'Pairs Engage' -> 'pairs-engage')"""
+    return app_name.translate(_SLUG_TR).lower()
+
+
+def get_model() -> str:
+    """使用するClaudeモデル名を取得"""
+    return os.getenv('CLAUDE_MODEL', 'claude-sonnet-4-20250514')
+
+
 def get_project_root() -> Path:
     """プロジェクトルートディレクトリを取得"""
     return Path(__file__).parent.parent
 
 
-def load_app_data(app_name: str) -> Dict[str, str]:
+@functools.lru_cache(maxsize=1)
+def _read_apps_index(csv_path_str: str, mtime_ns: int) -> Dict[str, Tuple[str, ...]]:
+    """apps.csvをパースしてアプリ名(小文字)をキーにした行の辞書を返す (mtimeが変わると再読み込み)"""
+    index: Dict[str, Tuple[str, ...]] = {}
+    with open(csv_path_str, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        name_i = header.index('app_name')
+        # 行はnamedtupleで保持する (行ごとの辞書よりメモリが少ない)
+        App = namedtuple('App', header, rename=True)
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row = row + [''] * (width - len(row))
+            # 同名アプリが複数ある場合は先頭の行を優先
+            index.setdefault(row[name_i].lower(), App._make(row[:width]))
+    return index
+
+
+def _apps_index() -> Dict[str, Tuple[str, ...]]:
     """
-    apps.csvからアプリ情報を読み込む
-
-    Args:
-        app_name: アプリ名
+    apps.csvのインデックスを取得
 
     Returns:
-        アプリ情報の辞書
+        アプリ名(小文字) -> 行(namedtuple) の辞書
 
     Raises:
-        AppNotFoundError: アプリが見つからない場合
+        AppNotFoundError: apps.csvが存在しない場合
+        ArticleGenerationError: CSVの読み込みに失敗した場合
     """
     csv_path = get_project_root() / 'data' / 'apps.csv'
 
-    if not csv_path.exists():
+    try:
+        mtime_ns = csv_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise AppNotFoundError(
             f"apps.csvが見つかりません: {csv_path}\n"
             "data/apps.csv.exampleをコピーしてapps.csvを作成してください。"
         )
 
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['app_name'].lower() == app_name.lower():
-                    return row
+        return _read_apps_index(str(csv_path), mtime_ns)
     except Exception as e:
         raise ArticleGenerationError(f"CSVファイルの読み込みに失敗しました: {e}")
 
-    raise AppNotFoundError(
-        f"アプリ '{app_name}' が apps.csv に見つかりません。\n"
-        f"利用可能なアプリを確認してください。"
-    )
+
+def load_app_data(app_name: str) -> Dict[str, str]:
+    """
+    apps.csvからアプリ情報を読み込む
+
+    Args:
+        app_name: アプリ名
+
+    Returns:
+        アプリ情報の辞書
+
+    Raises:
+        AppNotFoundError: アプリが見つからない場合
+    """
+    row = _apps_index().get(app_name.lower())
+
+    if row is None:
+        raise AppNotFoundError(
+            f"アプリ '{app_name}' が apps.csv に見つかりません。\n"
+            f"利用可能なアプリを確認してください。"
+        )
+
+    # 見つかった行だけ辞書に変換する
+    return row._asdict()
 
 
 def load_prompt_from_json(prompt_id: str) -> str:
@@ -140,6 +210,13 @@ def load_prompt_from_json(prompt_id: str) -> str:
         raise ArticleGenerationError(f"プロンプトの読み込みに失敗: {e}")
 
 
+@functools.lru_cache(maxsize=16)
+def _read_template_cached(path_str: str, mtime_ns: int) -> str:
+    """テンプレートファイルを読み込む (パスとmtimeが同じなら再読み込みしない)"""
+    with open(path_str, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 def load_prompt_template(article_type: str, prompt_id: Optional[str] = None) -> str:
     """
     プロンプトテンプレートを読み込む
@@ -173,12 +250,21 @@ def load_prompt_template(article_type: str, prompt_id: Optional[str] = None) ->
             )
 
     try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return _read_template_cached(str(template_path), template_path.stat().st_mtime_ns)
     except Exception as e:
         raise ArticleGenerationError(f"テンプレートの読み込みに失敗しました: {e}")
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_template(template: str) -> Tuple[str, ...]:
+    """
+    テンプレートをリテラル部分と変数名に分割する (同じテンプレートは1回だけ解析)
+
+    偶数番目の要素がリテラル、奇数番目の要素が変数名になる。
+    """
+    return tuple(_VAR_RE.split(template))
+
+
 def fill_template(template: str, app_data: Dict[str, str]) -> str:
     """
     テンプレートに変数を埋め込む
@@ -191,7 +277,7 @@ def fill_template(template: str, app_data: Dict[str, str]) -> str:
         変数が埋め込まれたプロンプト
     """
     current_date = datetime.now().strftime('%Y-%m-%d')
-    app_name_slug = app_data['app_name'].lower().replace(' ', '-')
+    app_name_slug = slugify_app_name(app_data['app_name'])
 
     # 変数マッピング
     variables = {
@@ -205,21 +291,109 @@ def fill_template(template: str, app_data: Dict[str, str]) -> str:
         'app_name_slug': app_name_slug,
     }
 
-    # テンプレート変数を置換
-    filled_template = template
-    for key, value in variables.items():
-        filled_template = filled_template.replace(f'{{{key}}}', value)
+    # 解析済みテンプレートに変数を埋め込む (未知の変数はそのまま残す)
+    parts = list(_compile_template(template))
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = variables.get(name, f'{{{name}}}')
+    return ''.join(parts)
+
+
+def _get_client(api_key: str) -> Anthropic:
+    """Claude APIクライアントを取得 (接続を使い回すため1プロセスで1つだけ作成)"""
+    global _client
+    if _client is None:
+        _client = Anthropic(api_key=api_key)
+    return _client
+
+
+def get_article_path(app_name_slug: str) -> Path:
+    """
+    記事の保存先パスを取得 (_drafts/YYYY-MM-DD-app-name-review.md)
+
+    Args:
+        app_name_slug: アプリ名のスラッグ (slugify_app_name の結果)
+
+    Returns:
+        保存先のパス
+    """
+    drafts_dir = get_project_root() / '_drafts'
+    drafts_dir.mkdir(exist_ok=True)
+
+    # ファイル名生成: YYYY-MM-DD-app-name-review.md
+    current_date = datetime.now().strftime('%Y-%m-%d')
+    filename = f"{current_date}-{app_name_slug}-review.md"
 
-    return filled_template
+    return drafts_dir / filename
 
 
-def generate_article_with_claude(prompt: str, api_key: str) -> str:
+def generate_article_with_claude(prompt: str, api_key: str, file_path: Path) -> int:
     """
-    Claude APIを使って記事を生成
+    Claude APIを使って記事を生成し、受信しながらファイルに書き込む
 
     Args:
         prompt: 完成したプロンプト
         api_key: Claude APIキー
+        file_path: 記事の保存先パス
+
+    Returns:
+        生成された記事の文字数
+
+    Raises:
+        ArticleGenerationError: API呼び出しまたは保存に失敗した場合
+    """
+    # 既存の下書きを壊さないよう一時ファイルに書き、完了してから置き換える
+    part_path = file_path.with_suffix('.md.part')
+    replaced = False
+
+    try:
+        client = _get_client(api_key)
+
+        model = get_model()
+
+        total_len = 0
+        with open(part_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            with client.messages.stream(
+                model=model,
+                max_tokens=8000,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            ) as stream:
+                # 受信したテキストをそのままファイルに書き込む
+                for text in stream.text_stream:
+                    f.write(text.encode('utf-8'))
+                    total_len += len(text)
+
+        if total_len == 0:
+            raise ArticleGenerationError("APIから空のレスポンスが返されました")
+
+        os.replace(part_path, file_path)
+        replaced = True
+
+        return total_len
+
+    except Exception as e:
+        raise ArticleGenerationError(f"Claude API呼び出しに失敗しました: {e}")
+
+    finally:
+        # 置き換える前に失敗・中断 (Ctrl+C) した場合は書きかけの一時ファイルだけを削除する
+        # (既存の下書きはそのまま残す)
+        if not replaced:
+            part_path.unlink(missing_ok=True)
+
+
+async def _gen_one(client: AsyncAnthropic, prompt: str, semaphore: asyncio.Semaphore) -> str:
+    """
+    Claude APIで記事を1件生成 (非同期)
+
+    Args:
+        client: 非同期APIクライアント
+        prompt: 完成したプロンプト
+        semaphore: 同時リクエスト数を制限するセマフォ
 
     Returns:
         生成された記事 (Markdown形式)
@@ -228,39 +402,53 @@ def generate_article_with_claude(prompt: str, api_key: str) -> str:
         ArticleGenerationError: API呼び出しに失敗した場合
     """
     try:
-        client = Anthropic(api_key=api_key)
-
-        model = os.getenv('CLAUDE_MODEL', 'claude-sonnet-4-20250514')
-
-        message = client.messages.create(
-            model=model,
-            max_tokens=8000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
+        async with semaphore:
+            message = await client.messages.create(
+                model=get_model(),
+                max_tokens=8000,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            )
 
-        # レスポンスからテキストを取得
         if not message.content:
             raise ArticleGenerationError("APIから空のレスポンスが返されました")
 
-        article_content = message.content[0].text
-        return article_content
+        return message.content[0].text
 
     except Exception as e:
         raise ArticleGenerationError(f"Claude API呼び出しに失敗しました: {e}")
 
 
-def save_article(content: str, app_name: str) -> Path:
+async def generate_articles_async(prompts: List[str], api_key: str) -> List[object]:
+    """
+    Claude APIで複数の記事を並列生成
+
+    Args:
+        prompts: 完成したプロンプトのリスト
+        api_key: Claude APIキー
+
+    Returns:
+        プロンプトと同じ順序の結果リスト (成功時は記事、失敗時は例外)
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+    async with AsyncAnthropic(api_key=api_key) as client:
+        return await asyncio.gather(
+            *[_gen_one(client, prompt, semaphore) for prompt in prompts],
+            return_exceptions=True
+        )
+
+
+def save_article(content: str, app_name_slug: str) -> Path:
     """
     記事を_drafts/に保存
 
     Args:
         content: 記事内容
-        app_name: アプリ名
+        app_name_slug: アプリ名のスラッグ (slugify_app_name の結果)
 
     Returns:
         保存先のパス
@@ -268,19 +456,10 @@ def save_article(content: str, app_name: str) -> Path:
     Raises:
         ArticleGenerationError: 保存に失敗した場合
     """
-    drafts_dir = get_project_root() / '_drafts'
-    drafts_dir.mkdir(exist_ok=True)
-
-    # ファイル名生成: YYYY-MM-DD-app-name-review.md
-    current_date = datetime.now().strftime('%Y-%m-%d')
-    app_name_slug = app_name.lower().replace(' ', '-')
-    filename = f"{current_date}-{app_name_slug}-review.md"
-
-    file_path = drafts_dir / filename
+    file_path = get_article_path(app_name_slug)
 
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        file_path.write_bytes(content.encode('utf-8'))
         return file_path
     except Exception as e:
         raise ArticleGenerationError(f"記事の保存に失敗しました: {e}")
@@ -304,8 +483,68 @@ def validate_args(args: argparse.Namespace) -> None:
             f"対応している記事タイプ: {', '.join(valid_types)}"
         )
 
-    if not args.app:
-        raise ValueError("--app 引数は必須です")
+    if not args.app and not args.apps:
+        raise ValueError("--app または --apps 引数は必須です")
+
+
+def generate_batch(apps_data: List[Dict[str, str]], article_type: str, prompt_id: Optional[str], api_key: str) -> int:
+    """
+    複数アプリの記事を並列生成して保存
+
+    Args:
+        apps_data: アプリ情報のリスト
+        article_type: 記事タイプ
+        prompt_id: プロンプトID
+        api_key: Claude APIキー
+
+    Returns:
+        終了コード
+    """
+    # プロンプトテンプレート読み込み
+    print("📋 プロンプトテンプレートを準備中...")
+    if prompt_id:
+        print(f"   カスタムプロンプトを使用: {prompt_id}")
+    template = load_prompt_template(article_type, prompt_id)
+    prompts = [fill_template(template, app_data) for app_data in apps_data]
+    print(f"   ✓ プロンプトを生成しました ({len(prompts)}件)")
+    print()
+
+    # Claude APIで記事を並列生成
+    print(f"🤖 Claude APIで記事を並列生成中... (同時実行数: {_MAX_CONCURRENCY})")
+    print("   (これには数分かかる場合があります)")
+    results = asyncio.run(generate_articles_async(prompts, api_key))
+    print()
+
+    # 記事を保存
+    print("💾 記事を保存中...")
+    failed = 0
+    for app_data, result in zip(apps_data, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            print(f"   ❌ {app_data['app_name']}: {result}", file=sys.stderr)
+            continue
+        # 1件の保存失敗で残りの生成済み記事 (API呼び出し済み) を失わないよう、次のアプリへ進む
+        try:
+            saved_path = save_article(result, slugify_app_name(app_data['app_name']))
+        except ArticleGenerationError as e:
+            failed += 1
+            print(f"   ❌ {app_data['app_name']}: {e}", file=sys.stderr)
+            continue
+        print(f"   ✓ {app_data['app_name']} ({len(result)}文字): {saved_path}")
+    print()
+
+    if failed:
+        print(f"⚠️  {failed}件の記事の生成または保存に失敗しました", file=sys.stderr)
+        return 1
+
+    print("✅ 記事生成が完了しました!")
+    print()
+    print("次のステップ:")
+    print("  1. エディタで確認: _drafts/")
+    print("  2. プレビュー: python scripts/preview.py")
+    print("  3. 公開: python scripts/publish.py <ファイルパス>")
+
+    return 0
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -321,13 +560,20 @@ def parse_arguments() -> argparse.Namespace:
         help='記事タイプ (review, ranking, howto) ※MVP版はreviewのみ対応'
     )
 
-    parser.add_argument(
+    app_group = parser.add_mutually_exclusive_group(required=True)
+
+    app_group.add_argument(
         '--app',
         type=str,
-        required=True,
         help='アプリ名 (例: Tinder, Pairs)'
     )
 
+    app_group.add_argument(
+        '--apps',
+        type=lambda value: [name.strip() for name in value.split(',') if name.strip()],
+        help='カンマ区切りの複数アプリ名 (例: Tinder,Pairs,Omiai) 並列で生成します'
+    )
+
     parser.add_argument(
         '--prompt',
         type=str,
@@ -346,18 +592,26 @@ def main() -> int:
 
         print(f"📝 記事生成を開始します...")
         print(f"   記事タイプ: {args.type}")
-        print(f"   アプリ名: {args.app}")
+        print(f"   アプリ名: {args.app or ', '.join(args.apps)}")
+        print()
+
+        # アプリ情報読み込み (存在しないアプリ名は環境変数やAPIキーを読む前にエラーにする)
+        print("📊 アプリ情報を読み込み中...")
+        if args.apps:
+            apps_data = [load_app_data(app_name) for app_name in args.apps]
+            print(f"   ✓ {len(apps_data)}件のアプリ情報を取得しました")
+        else:
+            app_data = load_app_data(args.app)
+            print(f"   ✓ {app_data['app_name']} の情報を取得しました")
         print()
 
         # 環境変数読み込み
         load_env()
         api_key = get_api_key()
 
-        # アプリ情報読み込み
-        print("📊 アプリ情報を読み込み中...")
-        app_data = load_app_data(args.app)
-        print(f"   ✓ {app_data['app_name']} の情報を取得しました")
-        print()
+        # 複数アプリのバッチ生成
+        if args.apps:
+            return generate_batch(apps_data, args.type, args.prompt, api_key)
 
         # プロンプトテンプレート読み込み
         print("📋 プロンプトテンプレートを準備中...")
@@ -368,16 +622,12 @@ def main() -> int:
         print(f"   ✓ プロンプトを生成しました")
         print()
 
-        # Claude APIで記事生成
+        # Claude APIで記事生成 (受信しながら保存)
         print("🤖 Claude APIで記事を生成中...")
         print("   (これには1-2分かかる場合があります)")
-        article = generate_article_with_claude(prompt, api_key)
-        print(f"   ✓ 記事を生成しました ({len(article)}文字)")
-        print()
-
-        # 記事を保存
-        print("💾 記事を保存中...")
-        saved_path = save_article(article, app_data['app_name'])
+        saved_path = get_article_path(slugify_app_name(app_data['app_name']))
+        article_len = generate_article_with_claude(prompt, api_key, saved_path)
+        print(f"   ✓ 記事を生成しました ({article_len}文字)")
         print(f"   ✓ 保存しました: {saved_path}")
         print()
 
@@ -20,11 +20,17 @@
 
 import argparse
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class PromptManagerError(Exception):
     """プロンプト管理エラー"""
@@ -58,6 +64,9 @@ def load_prompts() -> Dict:
         return {"prompts": []}
 
     try:
+        if orjson:
+            with open(prompts_file, 'rb') as f:
+                return orjson.loads(f.read())
         with open(prompts_file, 'r', encoding='utf-8') as f:
             return json.load(f)
     except json.JSONDecodeError as e:
@@ -66,6 +75,23 @@ def load_prompts() -> Dict:
         raise PromptManagerError(f"ファイルの読み込みに失敗: {e}")
 
 
+def index_prompts(data: Dict) -> Dict[str, Dict]:
+    """
+    プロンプトをIDで引ける辞書を作成
+
+    Args:
+        data: プロンプトデータ
+
+    Returns:
+        プロンプトID -> プロンプト の辞書
+    """
+    index: Dict[str, Dict] = {}
+    for prompt in data.get('prompts', []):
+        # 同じIDが重複している場合は先頭のものを優先
+        index.setdefault(prompt['id'], prompt)
+    return index
+
+
 def save_prompts(data: Dict) -> None:
     """
     プロンプトファイルに保存
@@ -77,11 +103,30 @@ def save_prompts(data: Dict) -> None:
         PromptManagerError: 保存に失敗した場合
     """
     prompts_file = get_prompts_file()
+    tmp_file = prompts_file.with_name(prompts_file.name + '.tmp')
 
     try:
-        with open(prompts_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            # orjsonのOPT_APPEND_NEWLINEと同じく末尾に改行を付ける (どちらで保存しても同じバイト列になるように)
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8') + b'\n'
+
+        # 一時ファイルに同期書き込みしてから置き換える (書き込み途中で壊れないように)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_DSYNC', 0)
+        fd = os.open(tmp_file, flags, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, prompts_file)
     except Exception as e:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
         raise PromptManagerError(f"ファイルの保存に失敗: {e}")
 
 
@@ -133,10 +178,9 @@ def show_prompt(prompt_id: str) -> int:
     """
     try:
         data = load_prompts()
-        prompts = data.get('prompts', [])
 
         # プロンプトを検索
-        prompt = next((p for p in prompts if p['id'] == prompt_id), None)
+        prompt = index_prompts(data).get(prompt_id)
 
         if not prompt:
             print(f"❌ プロンプト '{prompt_id}' が見つかりません", file=sys.stderr)
@@ -177,8 +221,7 @@ def add_prompt_interactive() -> int:
 
         # IDの重複チェック
         data = load_prompts()
-        existing_ids = [p['id'] for p in data.get('prompts', [])]
-        if prompt_id in existing_ids:
+        if prompt_id in index_prompts(data):
             print(f"❌ プロンプトID '{prompt_id}' は既に存在します", file=sys.stderr)
             return 1
 
@@ -194,15 +237,7 @@ def add_prompt_interactive() -> int:
         print("\nプロンプト内容を入力してください (終了するには空行で Ctrl+D を押す):")
         print("-" * 60)
 
-        content_lines = []
-        try:
-            while True:
-                line = input()
-                content_lines.append(line)
-        except EOFError:
-            pass
-
-        content = "\n".join(content_lines).strip()
+        content = sys.stdin.read().strip()
 
         if not content:
             print("\n❌ プロンプト内容は必須です", file=sys.stderr)
@@ -254,10 +289,9 @@ def delete_prompt(prompt_id: str) -> int:
     """
     try:
         data = load_prompts()
-        prompts = data.get('prompts', [])
 
         # プロンプトを検索
-        prompt = next((p for p in prompts if p['id'] == prompt_id), None)
+        prompt = index_prompts(data).get(prompt_id)
 
         if not prompt:
             print(f"❌ プロンプト '{prompt_id}' が見つかりません", file=sys.stderr)
@@ -272,7 +306,7 @@ def delete_prompt(prompt_id: str) -> int:
             return 0
 
         # 削除
-        data['prompts'] = [p for p in prompts if p['id'] != prompt_id]
+        data['prompts'] = [p for p in data.get('prompts', []) if p['id'] != prompt_id]
         save_prompts(data)
 
         print(f"✅ プロンプト '{prompt_id}' を削除しました")
@@ -299,10 +333,9 @@ def export_prompt(prompt_id: str, output_file: Optional[str] = None) -> int:
     """
     try:
         data = load_prompts()
-        prompts = data.get('prompts', [])
 
         # プロンプトを検索
-        prompt = next((p for p in prompts if p['id'] == prompt_id), None)
+        prompt = index_prompts(data).get(prompt_id)
 
         if not prompt:
             print(f"❌ プロンプト '{prompt_id}' が見つかりません", file=sys.stderr)
@@ -365,6 +398,10 @@ def parse_arguments() -> argparse.Namespace:
 def main() -> int:
     """メイン処理"""
     try:
+        # よく使う list コマンドは引数パーサーを構築せずに実行
+        if sys.argv[1:] == ['list']:
+            return list_prompts()
+
         args = parse_arguments()
 
         if not args.command:
@@ -6,14 +6,33 @@ Jekyllサーバーを起動してブラウザでプレビューします。
 
 使い方:
     python scripts/preview.py
+
+    # bundle exec jekyll --version で厳密にチェック
+    python scripts/preview.py --strict-check
+
+    # 初回ビルドが遅い場合は起動待ちの上限を延ばす (0で無制限)
+    python scripts/preview.py --startup-timeout 300
 """
 
+import argparse
 import os
+import shutil
+import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
 import webbrowser
+from collections import deque
 from pathlib import Path
+from typing import Deque, IO, Optional
+
+# サーバー起動待ちのデフォルト上限秒数 (初回ビルドやサイトが大きい場合に備えて長めにする)
+DEFAULT_STARTUP_TIMEOUT = 120.0
+
+# 起動待ち中に経過を表示する間隔 (秒)
+_PROGRESS_INTERVAL = 15.0
 
 
 class PreviewError(Exception):
@@ -21,13 +40,47 @@ class PreviewError(Exception):
     pass
 
 
+class PipeDrainer(threading.Thread):
+    """パイプの出力を読み続けるスレッド (パイプが詰まってサーバーが止まるのを防ぐ)"""
+
+    def __init__(self, pipe: IO[str], max_lines: int = 50):
+        super().__init__(daemon=True)
+        self.pipe = pipe
+        self.lines: Deque[str] = deque(maxlen=max_lines)
+
+    def run(self) -> None:
+        """末尾の数行だけ保持しながら出力を読み捨てる"""
+        for line in self.pipe:
+            self.lines.append(line)
+
+    def get_output(self, timeout: float = 1.0) -> str:
+        """保持している末尾の出力を取得"""
+        self.join(timeout)
+        return ''.join(self.lines)
+
+
 def get_project_root() -> Path:
     """プロジェクトルートディレクトリを取得"""
     return Path(__file__).parent.parent
 
 
-def check_jekyll_installed() -> bool:
-    """Jekyllがインストールされているかチェック"""
+def check_jekyll_installed(strict: bool = False) -> bool:
+    """
+    Jekyllがインストールされているかチェック
+
+    Args:
+        strict: Trueの場合は bundle exec jekyll --version を実行して確認する
+
+    Returns:
+        インストールされているかどうか
+    """
+    if not strict:
+        # bundlerがあり、bundle install 済み (Gemfile.lockがある) ならインストール済みとみなす
+        return (
+            shutil.which('bundle') is not None
+            and (get_project_root() / 'Gemfile.lock').exists()
+        )
+
     try:
         result = subprocess.run(
             ['bundle', 'exec', 'jekyll', '--version'],
@@ -46,6 +99,8 @@ def install_dependencies() -> None:
 
     project_root = get_project_root()
 
+    # Jekyllが見つからないと判定された時だけ呼ばれるため、スキップせず毎回 bundle install する
+    # (Gemfile.lockが変わっていなくてもgemが消えている場合があり、スキップすると直らない)
     try:
         # bundle install
         subprocess.run(
@@ -64,12 +119,100 @@ def install_dependencies() -> None:
         )
 
 
-def start_jekyll_server(port: int = 4000) -> subprocess.Popen:
+def _signal_process_group(process: subprocess.Popen, sig: int) -> None:
+    """プロセスグループ全体にシグナルを送る (未対応の環境ではプロセス本体のみ)"""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(os.getpgid(process.pid), sig)
+            return
+        except ProcessLookupError:
+            return
+    if sig == signal.SIGTERM:
+        process.terminate()
+    else:
+        process.kill()
+
+
+def stop_server(process: subprocess.Popen, timeout: float = 2.0) -> None:
+    """
+    サーバープロセスを子プロセスごと終了
+
+    Args:
+        process: サーバープロセス
+        timeout: SIGTERM後に強制終了するまでの待機秒数
+    """
+    _signal_process_group(process, signal.SIGTERM)
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _signal_process_group(process, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        process.wait()
+
+
+def _is_port_in_use(port: int) -> bool:
+    """ローカルのポートで接続を受け付けているプロセスがあるか"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        return sock.connect_ex(('127.0.0.1', port)) == 0
+
+
+def wait_for_server(
+    process: subprocess.Popen,
+    port: int,
+    stderr_drainer: Optional[PipeDrainer] = None,
+    timeout: float = DEFAULT_STARTUP_TIMEOUT
+) -> None:
+    """
+    サーバーがポートで接続を受け付けるまで待機
+
+    プロセスが生きている間は待ち続け、一定間隔で経過を表示する。
+
+    Args:
+        process: サーバープロセス
+        port: ポート番号
+        stderr_drainer: エラー出力を読み取っているスレッド
+        timeout: タイムアウト秒数 (0以下ならプロセスが生きている限り待ち続ける)
+
+    Raises:
+        PreviewError: サーバーが終了した場合またはタイムアウトした場合
+    """
+    start = time.monotonic()
+    deadline = start + timeout if timeout > 0 else float('inf')
+    next_progress = start + _PROGRESS_INTERVAL
+
+    while time.monotonic() < deadline:
+        # 接続できても起動したプロセスが終了していれば、応答したのは別のサーバー
+        if _is_port_in_use(port) and process.poll() is None:
+            return
+
+        # プロセスが死んでいないかチェック
+        if process.poll() is not None:
+            stderr = stderr_drainer.get_output() if stderr_drainer else ''
+            raise PreviewError(f"サーバー起動に失敗しました:\n{stderr}")
+
+        now = time.monotonic()
+        if now >= next_progress:
+            print(f"   まだ起動中です ({now - start:.0f}秒経過、Ctrl+Cで中断)...")
+            next_progress = now + _PROGRESS_INTERVAL
+
+        time.sleep(0.05)
+
+    stop_server(process)
+    raise PreviewError(
+        f"サーバーが{timeout:g}秒以内に起動しませんでした\n"
+        "--startup-timeout で待機時間を延ばせます (0で無制限)"
+    )
+
+
+def start_jekyll_server(
+    port: int = 4000,
+    startup_timeout: float = DEFAULT_STARTUP_TIMEOUT
+) -> subprocess.Popen:
     """
     Jekyllサーバーを起動
 
     Args:
         port: ポート番号
+        startup_timeout: 起動待ちの上限秒数 (0以下なら無制限)
 
     Returns:
         サーバープロセス
@@ -79,27 +222,40 @@ def start_jekyll_server(port: int = 4000) -> subprocess.Popen:
     """
     project_root = get_project_root()
 
+    # 既存のサーバーがあるとJekyllは起動に失敗し、待機は古いサーバーに接続して成功してしまう
+    if _is_port_in_use(port):
+        raise PreviewError(
+            f"ポート {port} は既に使用されています。\n"
+            "前回のプレビューサーバーなどが残っていれば終了してから再実行してください"
+        )
+
     try:
         print(f"🚀 Jekyllサーバーを起動中 (ポート: {port})...")
 
         process = subprocess.Popen(
             ['bundle', 'exec', 'jekyll', 'serve', '--drafts', '--port', str(port)],
             cwd=project_root,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
             bufsize=1,
-            universal_newlines=True
+            universal_newlines=True,
+            # bundle配下のRubyプロセスもまとめて終了できるよう新しいセッションで起動
+            start_new_session=True
         )
 
+        # エラー出力はスレッドで読み続ける (読まないとパイプが詰まってJekyllが停止する)
+        stderr_drainer = PipeDrainer(process.stderr)
+        stderr_drainer.start()
+
         # サーバー起動を待つ
+        # (別セッションのためCtrl+CはJekyllに届かない。中断時もここで止めないとポートを握ったまま残る)
         print("   サーバー起動を待機中...")
-        time.sleep(3)
-
-        # プロセスが死んでいないかチェック
-        if process.poll() is not None:
-            stdout, stderr = process.communicate()
-            raise PreviewError(f"サーバー起動に失敗しました:\n{stderr}")
+        try:
+            wait_for_server(process, port, stderr_drainer, timeout=startup_timeout)
+        except BaseException:
+            stop_server(process)
+            raise
 
         print("   ✓ サーバーが起動しました")
         return process
@@ -119,7 +275,6 @@ def open_browser(url: str) -> None:
     """ブラウザを開く"""
     try:
         print(f"🌐 ブラウザを起動中: {url}")
-        time.sleep(1)
         webbrowser.open(url)
         print("   ✓ ブラウザを開きました")
     except Exception as e:
@@ -139,8 +294,32 @@ def print_instructions() -> None:
     print("\n" + "=" * 60 + "\n")
 
 
+def parse_arguments() -> argparse.Namespace:
+    """コマンドライン引数をパース"""
+    parser = argparse.ArgumentParser(
+        description='Jekyllサーバーを起動して記事をプレビューします'
+    )
+
+    parser.add_argument(
+        '--strict-check',
+        action='store_true',
+        help='bundle exec jekyll --version を実行してJekyllのインストールを確認する'
+    )
+
+    parser.add_argument(
+        '--startup-timeout',
+        type=float,
+        default=DEFAULT_STARTUP_TIMEOUT,
+        metavar='SECONDS',
+        help=f'サーバー起動を待つ上限秒数 (0で無制限、デフォルト: {DEFAULT_STARTUP_TIMEOUT:g})'
+    )
+
+    return parser.parse_args()
+
+
 def main() -> int:
     """メイン処理"""
+    args = parse_arguments()
     port = 4000
     url = f"http://localhost:{port}"
     server_process = None
@@ -149,12 +328,12 @@ def main() -> int:
         print("🔍 ローカルプレビューを開始します\n")
 
         # Jekyllインストールチェック
-        if not check_jekyll_installed():
+        if not check_jekyll_installed(strict=args.strict_check):
             print("⚠️  Jekyllがインストールされていません")
             install_dependencies()
 
         # サーバー起動
-        server_process = start_jekyll_server(port)
+        server_process = start_jekyll_server(port, args.startup_timeout)
 
         # ブラウザを開く
         open_browser(url)
@@ -183,11 +362,7 @@ def main() -> int:
         # サーバープロセスを確実に終了
         if server_process and server_process.poll() is None:
             print("🛑 サーバーを終了中...")
-            server_process.terminate()
-            try:
-                server_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                server_process.kill()
+            stop_server(server_process)
             print("   ✓ サーバーを終了しました")
 
 
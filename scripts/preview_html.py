@@ -11,134 +11,85 @@ Jekyll不要で記事のHTMLプレビューを生成します。
 import argparse
 import re
 import sys
-import webbrowser
 from pathlib import Path
-from typing import Dict, Tuple
-import yaml
+from string import Template
+from typing import Dict, List, Tuple
 
+from _md_common import FrontMatterError, load_front_matter, split_front_matter
 
-def parse_markdown_file(file_path: Path) -> Tuple[Dict, str]:
-    """Markdownファイルをパース"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        raise Exception(f"ファイルの読み込みに失敗: {e}")
-
-    # Front matterと本文を分離
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
-
-    if not match:
-        return {}, content
-
-    try:
-        front_matter = yaml.safe_load(match.group(1))
-    except yaml.YAMLError:
-        front_matter = {}
-
-    body = match.group(2).strip()
-
-    return front_matter, body
-
-
-def markdown_to_html(markdown_text: str) -> str:
-    """簡易Markdown→HTML変換"""
-    html = markdown_text
-
-    # H2-H4見出し
-    html = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-    html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-
-    # リスト
-    html = re.sub(r'^\- (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-    html = re.sub(r'(<li>.*</li>\n?)+', r'<ul>\g<0></ul>', html, flags=re.DOTALL)
-
-    # 太字
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-
-    # リンク
-    html = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', html)
 
-    # 画像
-    html = re.sub(r'!\[(.+?)\]\((.+?)\)', r'<img src="\2" alt="\1" />', html)
+# 簡易Markdown変換用のパターン (見出し・リスト・太字・画像・リンクを1回の走査で処理)
+_MD_RE = re.compile(
+    r'(?P<heading>^(?P<heading_marks>#{2,4}) (?P<heading_text>.+)$)'
+    r'|(?P<li>^- (?P<li_text>.+)$)'
+    r'|(?P<bold>\*\*(?P<bold_text>.+?)\*\*)'
+    r'|(?P<img>!\[(?P<img_alt>.+?)\]\((?P<img_src>.+?)\))'
+    r'|(?P<link>\[(?P<link_text>.+?)\]\((?P<link_href>.+?)\))',
+    re.MULTILINE
+)
 
-    # 段落
-    html = re.sub(r'\n\n', '</p><p>', html)
-    html = f'<p>{html}</p>'
-
-    return html
-
-
-def generate_html(front_matter: Dict, body_html: str) -> str:
-    """HTMLページを生成"""
-    title = front_matter.get('title', '記事プレビュー')
-    description = front_matter.get('description', '')
-    date = front_matter.get('date', '')
-    categories = front_matter.get('categories', [])
-    tags = front_matter.get('tags', [])
 
-    html = f"""<!DOCTYPE html>
+# プレビューページのHTML (CSSを含む固定部分はimport時に1回だけ作成)
+_HTML_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <meta name="description" content="{description}">
+    <title>${title}</title>
+    <meta name="description" content="${description}">
     <style>
-        :root {{
+        :root {
             --primary-color: #3498db;
             --text-color: #333;
             --text-light: #666;
             --bg-light: #f8f9fa;
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Noto Sans JP', -apple-system, sans-serif;
             line-height: 1.8;
             color: var(--text-color);
             background-color: var(--bg-light);
             padding: 20px;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 800px;
             margin: 0 auto;
             background: white;
             padding: 40px;
             border-radius: 8px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .post-meta {{
+        .post-meta {
             color: var(--text-light);
             font-size: 0.9rem;
             margin-bottom: 1rem;
-        }}
+        }
 
-        .post-title {{
+        .post-title {
             font-size: 2rem;
             font-weight: 700;
             margin-bottom: 1rem;
             line-height: 1.4;
-        }}
+        }
 
-        .post-description {{
+        .post-description {
             font-size: 1.1rem;
             color: var(--text-light);
             margin-bottom: 2rem;
             padding-bottom: 2rem;
             border-bottom: 2px solid var(--bg-light);
-        }}
+        }
 
-        .category-link {{
+        .category-link {
             display: inline-block;
             background-color: var(--primary-color);
             color: white;
@@ -147,64 +98,64 @@ def generate_html(front_matter: Dict, body_html: str) -> str:
             text-decoration: none;
             font-size: 0.85rem;
             margin-right: 0.5rem;
-        }}
+        }
 
-        .post-content {{
+        .post-content {
             font-size: 1rem;
-        }}
+        }
 
-        .post-content h2 {{
+        .post-content h2 {
             font-size: 1.75rem;
             font-weight: 700;
             margin: 2rem 0 1rem;
             padding-bottom: 0.5rem;
             border-bottom: 3px solid var(--primary-color);
-        }}
+        }
 
-        .post-content h3 {{
+        .post-content h3 {
             font-size: 1.4rem;
             font-weight: 600;
             margin: 1.5rem 0 1rem;
-        }}
+        }
 
-        .post-content h4 {{
+        .post-content h4 {
             font-size: 1.2rem;
             font-weight: 600;
             margin: 1rem 0 0.5rem;
-        }}
+        }
 
-        .post-content p {{
+        .post-content p {
             margin-bottom: 1rem;
-        }}
+        }
 
-        .post-content ul {{
+        .post-content ul {
             margin-bottom: 1rem;
             padding-left: 2rem;
-        }}
+        }
 
-        .post-content li {{
+        .post-content li {
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .post-content a {{
+        .post-content a {
             color: var(--primary-color);
             text-decoration: underline;
-        }}
+        }
 
-        .post-content img {{
+        .post-content img {
             max-width: 100%;
             height: auto;
             border-radius: 8px;
             margin: 1rem 0;
-        }}
+        }
 
-        .post-tags {{
+        .post-tags {
             margin-top: 2rem;
             padding-top: 2rem;
             border-top: 1px solid #e0e0e0;
-        }}
+        }
 
-        .tag {{
+        .tag {
             display: inline-block;
             background-color: var(--bg-light);
             padding: 0.4rem 0.8rem;
@@ -213,9 +164,9 @@ def generate_html(front_matter: Dict, body_html: str) -> str:
             font-size: 0.9rem;
             margin-right: 0.5rem;
             color: var(--text-color);
-        }}
+        }
 
-        .preview-notice {{
+        .preview-notice {
             background: #fff3cd;
             border: 1px solid #ffc107;
             color: #856404;
@@ -223,7 +174,7 @@ def generate_html(front_matter: Dict, body_html: str) -> str:
             border-radius: 4px;
             margin-bottom: 2rem;
             text-align: center;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -235,30 +186,158 @@ def generate_html(front_matter: Dict, body_html: str) -> str:
         <article class="post">
             <header class="post-header">
                 <div class="post-meta">
-                    <time>{date}</time>
-                    {' • ' if categories else ''}
-                    {''.join([f'<span class="category-link">{cat}</span>' for cat in categories])}
+                    <time>${date}</time>
+                    ${meta_separator}
+                    ${categories_html}
                 </div>
 
-                <h1 class="post-title">{title}</h1>
+                <h1 class="post-title">${title}</h1>
 
-                <p class="post-description">{description}</p>
+                <p class="post-description">${description}</p>
             </header>
 
             <div class="post-content">
-                {body_html}
+                ${body_html}
             </div>
 
-            {f'''<footer class="post-tags">
-                <strong>タグ:</strong>
-                {''.join([f'<span class="tag">#{tag}</span>' for tag in tags])}
-            </footer>''' if tags else ''}
+            ${tags_html}
         </article>
     </div>
 </body>
-</html>"""
+</html>""")
+
+
+def parse_markdown_file(file_path: Path) -> Tuple[Dict, str]:
+    """Markdownファイルをパース"""
+    try:
+        content = file_path.read_text(encoding='utf-8')
+    except Exception as e:
+        raise Exception(f"ファイルの読み込みに失敗: {e}")
+
+    # Front matterと本文を分離
+    parts = split_front_matter(content)
+
+    if parts is None:
+        return {}, content
+
+    yaml_text, body = parts
+
+    try:
+        front_matter = load_front_matter(yaml_text)
+    except FrontMatterError:
+        front_matter = {}
+
+    return front_matter, body
+
+
+def _inline(text: str) -> str:
+    """見出し・リスト項目などの内側にある太字・画像・リンクを変換"""
+    return _MD_RE.sub(_convert_match, text)
+
+
+def _convert_heading(m: re.Match) -> str:
+    level = len(m.group('heading_marks'))
+    return f"<h{level}>{_inline(m.group('heading_text'))}</h{level}>"
+
+
+def _convert_li(m: re.Match) -> str:
+    return f"<li>{_inline(m.group('li_text'))}</li>"
+
+
+def _convert_bold(m: re.Match) -> str:
+    return f"<strong>{_inline(m.group('bold_text'))}</strong>"
+
+
+def _convert_img(m: re.Match) -> str:
+    return f'<img src="{m.group("img_src")}" alt="{m.group("img_alt")}" />'
+
+
+def _convert_link(m: re.Match) -> str:
+    return f'<a href="{m.group("link_href")}">{_inline(m.group("link_text"))}</a>'
+
+
+_HANDLERS = {
+    'heading': _convert_heading,
+    'li': _convert_li,
+    'bold': _convert_bold,
+    'img': _convert_img,
+    'link': _convert_link,
+}
+
+
+def _convert_match(m: re.Match) -> str:
+    """マッチした要素の種類に応じてHTMLに変換"""
+    return _HANDLERS[m.lastgroup](m)
+
+
+def _close_list(out: List[str]) -> None:
+    """最後の<li>行の末尾 (改行の前) に</ul>を付ける"""
+    last = out[-1]
+    body = last.rstrip('\r\n')
+    out[-1] = body + '</ul>' + last[len(body):]
+
+
+def _wrap_lists(html: str) -> str:
+    """連続する<li>行を<ul>で囲む (1行ずつ走査するので入力長に対して線形)"""
+    out = []
+    in_list = False
+
+    for line in html.splitlines(keepends=True):
+        is_item = line.startswith('<li>')
+        if is_item and not in_list:
+            line = '<ul>' + line
+        elif in_list and not is_item:
+            # </ul>は最後の<li>行の改行の前に付ける (後ろの空行による段落分けを崩さない)
+            _close_list(out)
+        in_list = is_item
+        out.append(line)
+
+    if in_list:
+        _close_list(out)
+
+    return ''.join(out)
+
+
+def markdown_to_html(markdown_text: str) -> str:
+    """簡易Markdown→HTML変換"""
+    # 見出し・リスト・太字・画像・リンク
+    html = _MD_RE.sub(_convert_match, markdown_text)
+
+    # 連続するリスト項目を<ul>で囲む
+    html = _wrap_lists(html)
+
+    # 段落
+    return '<p>' + '</p><p>'.join(html.split('\n\n')) + '</p>'
+
+
+def generate_html(front_matter: Dict, body_html: str) -> str:
+    """HTMLページを生成"""
+    title = front_matter.get('title', '記事プレビュー')
+    description = front_matter.get('description', '')
+    date = front_matter.get('date', '')
+    categories = front_matter.get('categories', [])
+    tags = front_matter.get('tags', [])
+
+    categories_html = ''.join([f'<span class="category-link">{cat}</span>' for cat in categories])
+
+    tags_html = ''
+    if tags:
+        tags_html = (
+            '<footer class="post-tags">\n'
+            '                <strong>タグ:</strong>\n'
+            '                ' + ''.join([f'<span class="tag">#{tag}</span>' for tag in tags]) + '\n'
+            '            </footer>'
+        )
 
-    return html
+    return _HTML_TEMPLATE.substitute(
+        title=title,
+        description=description,
+        date=date,
+        meta_separator=' • ' if categories else '',
+        categories_html=categories_html,
+        body_html=body_html,
+        tags_html=tags_html,
+    )
 
 
 def main() -> int:
@@ -286,13 +365,13 @@ def main() -> int:
 
         # 一時ファイルに保存
         output_path = Path('/tmp') / f'{file_path.stem}_preview.html'
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(full_html)
+        output_path.write_text(full_html, encoding='utf-8')
 
         print(f"✅ プレビューを生成しました: {output_path}")
 
         # ブラウザで開く
         if not args.no_open:
+            import webbrowser
             print("🌐 ブラウザで開いています...")
             webbrowser.open(f'file://{output_path}')
 
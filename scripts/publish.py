@@ -9,14 +9,25 @@
 """
 
 import argparse
+import os
 import re
-import shutil
+import stat
 import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# gitコマンドなら実行されるフック (pygit2のコミットでは実行されない)
+_COMMIT_HOOKS = ('pre-commit', 'prepare-commit-msg', 'commit-msg', 'post-commit')
+
+_TITLE_RE = re.compile(r'^title:\s*["\']?(.+?)["\']?\s*$', re.MULTILINE)
+
 
 class PublishError(Exception):
     """公開エラー"""
@@ -38,10 +49,12 @@ def validate_file_path(file_path: Path) -> None:
     Raises:
         PublishError: 検証に失敗した場合
     """
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except OSError:
         raise PublishError(f"ファイルが見つかりません: {file_path}")
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise PublishError(f"ファイルではありません: {file_path}")
 
     if file_path.suffix != '.md':
@@ -95,6 +108,16 @@ def move_to_posts(draft_path: Path) -> Path:
         )
 
     try:
+        # _drafts/と_posts/は通常同一ファイルシステムなのでrenameで済む
+        draft_path.rename(destination)
+        return destination
+    except OSError:
+        pass  # 別デバイス等の場合はshutil.moveにフォールバック
+    except Exception as e:
+        raise PublishError(f"ファイルの移動に失敗しました: {e}")
+
+    try:
+        import shutil
         shutil.move(str(draft_path), str(destination))
         return destination
     except Exception as e:
@@ -112,11 +135,16 @@ def extract_title_from_file(file_path: Path) -> Optional[str]:
         タイトル文字列、見つからない場合はNone
     """
     try:
+        # Front matterの終わり(2つ目の---)までだけ読む
+        lines = []
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            for line in f:
+                lines.append(line)
+                if line.strip() == '---' and len(lines) > 1:
+                    break
 
         # Front matterからタイトルを抽出
-        match = re.search(r'^title:\s*["\']?(.+?)["\']?\s*$', content, re.MULTILINE)
+        match = _TITLE_RE.search(''.join(lines))
         if match:
             return match.group(1).strip('"\'')
 
@@ -148,10 +176,76 @@ def generate_commit_message(file_path: Path) -> str:
         return f"feat: 新規記事公開 - {title_part}"
 
 
+def _open_repo_for_in_process_commit() -> Optional['pygit2.Repository']:
+    """
+    pygit2でコミットできるリポジトリを開く
+
+    pygit2のコミットではフックも署名も実行されないため、コミット用のフックや
+    commit.gpgsign が設定されている場合はgitコマンドに任せる。
+
+    Returns:
+        リポジトリ、gitコマンドでコミットすべき場合はNone
+    """
+    try:
+        repo = pygit2.Repository(str(get_project_root()))
+        config = repo.config
+
+        if 'commit.gpgsign' in config and config.get_bool('commit.gpgsign'):
+            return None
+
+        if 'core.hooksPath' in config:
+            hooks_dir = Path(repo.workdir, os.path.expanduser(config['core.hooksPath']))
+        else:
+            hooks_dir = Path(repo.path, 'hooks')
+    except (pygit2.GitError, KeyError, ValueError):
+        return None
+
+    for hook in _COMMIT_HOOKS:
+        if os.access(hooks_dir / hook, os.X_OK):
+            return None
+
+    return repo
+
+
+def _commit_with_pygit2(repo: 'pygit2.Repository', file_path: Path, commit_message: str) -> None:
+    """
+    pygit2でステージングとコミットをプロセス内で実行 (gitコマンドを起動しない)
+
+    Args:
+        repo: リポジトリ
+        file_path: コミットするファイルのパス
+        commit_message: コミットメッセージ
+
+    Raises:
+        PublishError: コミットに失敗した場合、またはコミットする変更がない場合
+    """
+    try:
+        workdir = Path(repo.workdir).resolve()
+        relative_path = file_path.resolve().relative_to(workdir).as_posix()
+
+        repo.index.add(relative_path)
+        repo.index.write()
+        tree = repo.index.write_tree()
+
+        # git commit と同様、変更がなければ空のコミットは作らない
+        if not repo.head_is_unborn and repo.head.peel(pygit2.Commit).tree_id == tree:
+            raise PublishError("Gitコミットに失敗しました:\nコミットする変更がありません")
+
+        signature = repo.default_signature
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+        repo.create_commit('HEAD', signature, signature, commit_message, tree, parents)
+    except (pygit2.GitError, KeyError, ValueError) as e:
+        raise PublishError(f"Gitコミットに失敗しました:\n{e}")
+
+
 def git_commit_and_push(file_path: Path, auto_push: bool = False) -> None:
     """
     Gitにコミット(オプションでpush)
 
+    pygit2がインストールされている場合はプロセス内でコミットし、
+    なければ git add / git commit を実行する。コミット用のフックや
+    commit.gpgsign が設定されている場合はpygit2があってもgitコマンドを使う。
+
     Args:
         file_path: コミットするファイルのパス
         auto_push: 自動的にpushするかどうか
@@ -162,29 +256,39 @@ def git_commit_and_push(file_path: Path, auto_push: bool = False) -> None:
     project_root = get_project_root()
 
     try:
-        # git add
-        print("📝 Git: ファイルをステージング中...")
-        subprocess.run(
-            ['git', 'add', str(file_path)],
-            cwd=project_root,
-            check=True,
-            capture_output=True
-        )
-        print("   ✓ ファイルをステージングしました")
-
         # コミットメッセージ生成
         commit_message = generate_commit_message(file_path)
-        print(f"   コミットメッセージ: {commit_message}")
-
-        # git commit
-        print("💾 Git: コミット中...")
-        subprocess.run(
-            ['git', 'commit', '-m', commit_message],
-            cwd=project_root,
-            check=True,
-            capture_output=True
-        )
-        print("   ✓ コミットしました")
+
+        repo = _open_repo_for_in_process_commit() if pygit2 else None
+
+        if repo is not None:
+            print("💾 Git: コミット中...")
+            print(f"   コミットメッセージ: {commit_message}")
+            _commit_with_pygit2(repo, file_path, commit_message)
+            print("   ✓ コミットしました")
+        else:
+            # git add
+            print("📝 Git: ファイルをステージング中...")
+            subprocess.run(
+                ['git', 'add', str(file_path)],
+                cwd=project_root,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            print("   ✓ ファイルをステージングしました")
+            print(f"   コミットメッセージ: {commit_message}")
+
+            # git commit
+            print("💾 Git: コミット中...")
+            subprocess.run(
+                ['git', 'commit', '-m', commit_message],
+                cwd=project_root,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            print("   ✓ コミットしました")
 
         # git push (オプション)
         if auto_push:
@@ -193,7 +297,8 @@ def git_commit_and_push(file_path: Path, auto_push: bool = False) -> None:
                 ['git', 'push'],
                 cwd=project_root,
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             print("   ✓ プッシュしました")
         else:
@@ -9,11 +9,22 @@ SEO最適化スクリプト
 """
 
 import argparse
+import io
+import json
 import re
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import yaml
+
+from _md_common import FrontMatterError, load_front_matter, split_front_matter
+
+
+# 本文中の画像のパターン
+_IMG_RE = re.compile(r'!\[(.*?)\]\((.*?)\)')
+
+# 文字数カウント時に除外するMarkdown記号
+_MD_SYMBOLS = '#*-_`'
 
 
 class SEOValidationError(Exception):
@@ -44,45 +55,112 @@ class SEOReport:
         """提案を追加"""
         self.suggestions.append(f"💡 {message}")
 
-    def print_report(self) -> None:
-        """レポートを表示"""
-        print("\n" + "=" * 60)
-        print("📊 SEO検証レポート")
-        print("=" * 60)
+    def print_report(self, body_checked: bool = True) -> None:
+        """
+        レポートを表示 (バッファにまとめて1回で出力)
+
+        Args:
+            body_checked: 本文を検証したか (Falseの場合は本文の警告が含まれないためスコアを表示しない)
+        """
+        buf = io.StringIO()
+        w = buf.write
+
+        w("\n" + "=" * 60 + "\n")
+        w("📊 SEO検証レポート\n")
+        w("=" * 60 + "\n")
 
         if self.errors:
-            print("\n🔴 エラー:")
+            w("\n🔴 エラー:\n")
             for error in self.errors:
-                print(f"  {error}")
+                w(f"  {error}\n")
 
         if self.warnings:
-            print("\n🟡 警告:")
+            w("\n🟡 警告:\n")
             for warning in self.warnings:
-                print(f"  {warning}")
+                w(f"  {warning}\n")
 
         if self.suggestions:
-            print("\n💡 改善提案:")
+            w("\n💡 改善提案:\n")
             for suggestion in self.suggestions:
-                print(f"  {suggestion}")
-
-        # スコア表示
-        print(f"\n{'=' * 60}")
-        print(f"総合スコア: {self.score}/100")
+                w(f"  {suggestion}\n")
 
-        if self.score >= 80:
-            print("✅ SEOスコア: 良好")
-        elif self.score >= 60:
-            print("⚠️  SEOスコア: 改善の余地あり")
+        # スコア表示 (本文を検証していない場合は本文の減点が入らず高く出るため表示しない)
+        w(f"\n{'=' * 60}\n")
+        if not body_checked:
+            w("⏭️  フロントマターに不備があるため本文 (キーワード・見出し・画像) は未検証です\n")
+            w("   総合スコアは算出していません。フロントマターを修正して再実行してください\n")
         else:
-            print("❌ SEOスコア: 要改善")
+            w(f"総合スコア: {self.score}/100\n")
+
+            if self.score >= 80:
+                w("✅ SEOスコア: 良好\n")
+            elif self.score >= 60:
+                w("⚠️  SEOスコア: 改善の余地あり\n")
+            else:
+                w("❌ SEOスコア: 要改善\n")
 
-        print("=" * 60 + "\n")
+        w("=" * 60 + "\n\n")
+
+        sys.stdout.write(buf.getvalue())
 
     def has_critical_issues(self) -> bool:
         """重大な問題があるかチェック"""
         return len(self.errors) > 0
 
 
+@dataclass
+class BodyIndex:
+    """本文の構造情報 (各検証で本文を再走査しないよう1回だけ作成する)"""
+
+    h1: List[str]
+    h2: List[str]
+    h3: List[str]
+    images: List[Tuple[str, str]]
+    total_chars: int
+    lower: str
+
+    def keyword_density(self, keyword: str) -> float:
+        """キーワード密度(%)を計算 (小文字化済みの本文を使い回す)"""
+        if self.total_chars <= 0:
+            return 0
+        return len(keyword) * self.lower.count(keyword.lower()) / self.total_chars * 100
+
+
+def _heading_level(line: str) -> int:
+    """見出し行のレベルを返す (見出しでなければ0、'#'の後の空白は全角スペースも可)"""
+    level = len(line) - len(line.lstrip('#'))
+    if level and len(line) > level + 1 and line[level].isspace():
+        return level
+    return 0
+
+
+def build_body_index(body: str) -> BodyIndex:
+    """
+    本文を走査して構造情報を作成
+
+    Args:
+        body: 記事本文
+
+    Returns:
+        本文の構造情報
+    """
+    headings: Dict[int, List[str]] = {1: [], 2: [], 3: []}
+    for line in body.splitlines():
+        if line.startswith('#'):
+            level = _heading_level(line)
+            if level in headings:
+                headings[level].append(line)
+
+    return BodyIndex(
+        h1=headings[1],
+        h2=headings[2],
+        h3=headings[3],
+        images=_IMG_RE.findall(body),
+        total_chars=len(body) - sum(map(body.count, _MD_SYMBOLS)),  # Markdown記号を除いた文字数
+        lower=body.lower(),
+    )
+
+
 def parse_markdown_file(file_path: Path) -> Tuple[Dict, str]:
     """
     Markdownファイルをパースしてfront matterと本文を取得
@@ -95,30 +173,31 @@ def parse_markdown_file(file_path: Path) -> Tuple[Dict, str]:
 
     Raises:
         SEOValidationError: パースに失敗した場合
+        FileNotFoundError: ファイルが存在しない場合
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = file_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        raise
     except Exception as e:
         raise SEOValidationError(f"ファイルの読み込みに失敗: {e}")
 
     # Front matterと本文を分離
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
+    parts = split_front_matter(content)
 
-    if not match:
+    if parts is None:
         raise SEOValidationError(
             "Front matterが見つかりません。\n"
             "記事は '---' で囲まれたYAML形式のメタデータで始まる必要があります。"
         )
 
+    yaml_text, body = parts
+
     try:
-        front_matter = yaml.safe_load(match.group(1))
-    except yaml.YAMLError as e:
+        front_matter = load_front_matter(yaml_text)
+    except FrontMatterError as e:
         raise SEOValidationError(f"Front matterのYAMLパースに失敗: {e}")
 
-    body = match.group(2).strip()
-
     return front_matter, body
 
 
@@ -154,7 +233,7 @@ def validate_description(description: Optional[str], report: SEOReport) -> None:
         report.add_suggestion("検索結果で切り捨てられる可能性があります")
 
 
-def validate_keywords(front_matter: Dict, body: str, report: SEOReport) -> None:
+def validate_keywords(front_matter: Dict, index: BodyIndex, report: SEOReport) -> None:
     """キーワード密度を検証"""
     tags = front_matter.get('tags', [])
 
@@ -162,9 +241,8 @@ def validate_keywords(front_matter: Dict, body: str, report: SEOReport) -> None:
         report.add_warning("タグが設定されていません")
         return
 
-    # 本文の総単語数（簡易的にスペース区切りで計算）
-    body_text = re.sub(r'[#*\-_`]', '', body)  # Markdown記号を除去
-    total_chars = len(body_text)
+    # 本文の総文字数（Markdown記号を除く）
+    total_chars = index.total_chars
 
     if total_chars < 3000:
         report.add_warning(f"本文が短すぎます ({total_chars}文字)")
@@ -173,8 +251,7 @@ def validate_keywords(front_matter: Dict, body: str, report: SEOReport) -> None:
     # メインタグのキーワード密度をチェック
     if tags:
         main_keyword = tags[0]
-        keyword_count = body.lower().count(main_keyword.lower())
-        keyword_density = (len(main_keyword) * keyword_count / total_chars) * 100 if total_chars > 0 else 0
+        keyword_density = index.keyword_density(main_keyword)
 
         if keyword_density < 1:
             report.add_suggestion(f"キーワード '{main_keyword}' の出現頻度が低い可能性があります")
@@ -182,18 +259,16 @@ def validate_keywords(front_matter: Dict, body: str, report: SEOReport) -> None:
             report.add_warning(f"キーワード '{main_keyword}' の詰め込みすぎに注意")
 
 
-def validate_headings(body: str, report: SEOReport) -> None:
+def validate_headings(index: BodyIndex, report: SEOReport) -> None:
     """見出し階層を検証"""
     # H1の検出（あってはいけない）
-    h1_pattern = r'^#\s+.+$'
-    h1_matches = re.findall(h1_pattern, body, re.MULTILINE)
+    h1_matches = index.h1
 
     if h1_matches:
         report.add_error("本文中にH1見出しがあります。H1はタイトルのみで使用してください。")
 
     # H2の検出
-    h2_pattern = r'^##\s+.+$'
-    h2_matches = re.findall(h2_pattern, body, re.MULTILINE)
+    h2_matches = index.h2
 
     if not h2_matches:
         report.add_error("H2見出しが見つかりません", penalty=15)
@@ -203,8 +278,7 @@ def validate_headings(body: str, report: SEOReport) -> None:
         report.add_suggestion("5-7個のH2見出しが推奨されます")
 
     # H3の検出
-    h3_pattern = r'^###\s+.+$'
-    h3_matches = re.findall(h3_pattern, body, re.MULTILINE)
+    h3_matches = index.h3
 
     if not h3_matches:
         report.add_suggestion("H3見出しを使って、より詳細な構造化を検討してください")
@@ -219,15 +293,14 @@ def validate_required_fields(front_matter: Dict, report: SEOReport) -> None:
             report.add_error(f"必須フィールド '{field}' が設定されていません", penalty=15)
 
 
-def validate_images(front_matter: Dict, body: str, report: SEOReport) -> None:
+def validate_images(front_matter: Dict, index: BodyIndex, report: SEOReport) -> None:
     """画像を検証"""
     # アイキャッチ画像
     if 'image' not in front_matter:
         report.add_warning("アイキャッチ画像が設定されていません")
 
     # 本文中の画像のalt属性チェック
-    img_pattern = r'!\[(.*?)\]\((.*?)\)'
-    images = re.findall(img_pattern, body)
+    images = index.images
 
     images_without_alt = [img for img in images if not img[0]]
 
@@ -244,29 +317,33 @@ def generate_structured_data(front_matter: Dict, file_path: Path) -> str:
     image = front_matter.get('image', '')
     author = front_matter.get('author', 'マッチングアプリ研究所')
 
-    structured_data = f'''
-<!-- Structured Data (JSON-LD) -->
-<script type="application/ld+json">
-{{
-  "@context": "https://schema.org",
-  "@type": "Article",
-  "headline": "{title}",
-  "description": "{description}",
-  "datePublished": "{date}",
-  "image": "{image}",
-  "author": {{
-    "@type": "Person",
-    "name": "{author}"
-  }},
-  "publisher": {{
-    "@type": "Organization",
-    "name": "マッチングアプリ完全ガイド"
-  }}
-}}
-</script>
-'''
-
-    return structured_data.strip()
+    payload = {
+        "@context": "https://schema.org",
+        "@type": "Article",
+        "headline": title,
+        "description": description,
+        "datePublished": date,
+        "image": image,
+        "author": {
+            "@type": "Person",
+            "name": author
+        },
+        "publisher": {
+            "@type": "Organization",
+            "name": "マッチングアプリ完全ガイド"
+        }
+    }
+
+    # 引用符などはjson.dumpsでエスケープ (日付はYAMLでdate型になるためstrに変換)
+    # '</' はscriptタグを閉じないようにエスケープする
+    json_ld = json.dumps(payload, ensure_ascii=False, indent=2, default=str).replace('</', '<\\/')
+
+    return (
+        '<!-- Structured Data (JSON-LD) -->\n'
+        '<script type="application/ld+json">\n'
+        f'{json_ld}\n'
+        '</script>'
+    )
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -296,14 +373,14 @@ def main() -> int:
         args = parse_arguments()
         file_path = Path(args.file)
 
-        if not file_path.exists():
-            print(f"❌ ファイルが見つかりません: {file_path}", file=sys.stderr)
-            return 1
-
         print(f"🔍 SEO検証を開始します: {file_path.name}")
 
-        # Markdownファイルをパース
-        front_matter, body = parse_markdown_file(file_path)
+        # Markdownファイルをパース (存在確認は読み込み時の例外で兼ねる)
+        try:
+            front_matter, body = parse_markdown_file(file_path)
+        except FileNotFoundError:
+            print(f"❌ ファイルが見つかりません: {file_path}", file=sys.stderr)
+            return 1
 
         # SEO検証
         report = SEOReport()
@@ -311,9 +388,17 @@ def main() -> int:
         validate_required_fields(front_matter, report)
         validate_title(front_matter.get('title'), report)
         validate_description(front_matter.get('description'), report)
-        validate_keywords(front_matter, body, report)
-        validate_headings(body, report)
-        validate_images(front_matter, body, report)
+
+        # フロントマターに不備がある場合は終了コードが変わらないため本文の走査を省略
+        # (レポートには本文が未検証であることを明示し、スコアは表示しない)
+        if report.has_critical_issues():
+            report.print_report(body_checked=False)
+            return 1
+
+        index = build_body_index(body)
+        validate_keywords(front_matter, index, report)
+        validate_headings(index, report)
+        validate_images(front_matter, index, report)
 
         # レポート表示
         report.print_report()
@@ -16,7 +16,9 @@
 """
 
 import argparse
+import functools
 import http.server
+import mimetypes
 import os
 import re
 import socketserver
@@ -24,267 +26,67 @@ import sys
 import threading
 import time
 import webbrowser
+import zlib
 from pathlib import Path
-from typing import Dict, List, Tuple
-from urllib.parse import parse_qs, urlparse
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlparse
 
 try:
     import yaml
+    # libyamlがあればC実装のローダーを使う
+    _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 except ImportError:
     yaml = None
 
-
-class PreviewHandler(http.server.SimpleHTTPRequestHandler):
-    """カスタムHTTPリクエストハンドラー"""
-
-    def __init__(self, *args, project_root=None, **kwargs):
-        self.project_root = project_root or Path.cwd()
-        super().__init__(*args, **kwargs)
-
-    def do_GET(self):
-        """GETリクエストの処理"""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-
-        if path == '/' or path == '/index.html':
-            # 記事一覧ページ
-            self.serve_index()
-        elif path.startswith('/preview/'):
-            # 記事プレビュー
-            file_param = parse_qs(parsed_path.query).get('file', [None])[0]
-            if file_param:
-                self.serve_article_preview(file_param)
-            else:
-                self.send_error(400, "Missing file parameter")
-        elif path.startswith('/assets/'):
-            # 静的ファイル
-            self.serve_static_file(path)
-        else:
-            self.send_error(404, "File not found")
-
-    def serve_index(self):
-        """記事一覧ページを表示"""
-        drafts = self.get_markdown_files('_drafts')
-        posts = self.get_markdown_files('_posts')
-
-        html = self.generate_index_html(drafts, posts)
-
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html.encode('utf-8'))
-
-    def serve_article_preview(self, file_path: str):
-        """記事プレビューページを表示"""
-        full_path = self.project_root / file_path
-
-        if not full_path.exists():
-            self.send_error(404, f"File not found: {file_path}")
-            return
-
-        try:
-            front_matter, body = self.parse_markdown_file(full_path)
-            body_html = self.markdown_to_html(body)
-            html = self.generate_article_html(front_matter, body_html, file_path)
-
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(html.encode('utf-8'))
-
-        except Exception as e:
-            self.send_error(500, f"Error processing file: {e}")
-
-    def serve_static_file(self, path: str):
-        """静的ファイルを提供"""
-        file_path = self.project_root / path.lstrip('/')
-
-        if not file_path.exists():
-            self.send_error(404, "File not found")
-            return
-
-        # MIMEタイプを推測
-        if path.endswith('.css'):
-            content_type = 'text/css'
-        elif path.endswith('.js'):
-            content_type = 'application/javascript'
-        elif path.endswith('.jpg') or path.endswith('.jpeg'):
-            content_type = 'image/jpeg'
-        elif path.endswith('.png'):
-            content_type = 'image/png'
-        else:
-            content_type = 'application/octet-stream'
-
-        try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-
-            self.send_response(200)
-            self.send_header('Content-type', content_type)
-            self.end_headers()
-            self.wfile.write(content)
-
-        except Exception as e:
-            self.send_error(500, f"Error reading file: {e}")
-
-    def get_markdown_files(self, directory: str) -> List[Dict]:
-        """Markdownファイル一覧を取得"""
-        dir_path = self.project_root / directory
-
-        if not dir_path.exists():
-            return []
-
-        files = []
-        for file_path in sorted(dir_path.glob('*.md'), reverse=True):
-            try:
-                front_matter, _ = self.parse_markdown_file(file_path)
-                files.append({
-                    'path': f'{directory}/{file_path.name}',
-                    'name': file_path.name,
-                    'title': front_matter.get('title', file_path.stem),
-                    'date': front_matter.get('date', ''),
-                    'categories': front_matter.get('categories', []),
-                })
-            except:
-                # パースエラーは無視
-                pass
-
-        return files
-
-    def parse_markdown_file(self, file_path: Path) -> Tuple[Dict, str]:
-        """Markdownファイルをパース"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Front matterと本文を分離
-        pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-        match = re.match(pattern, content, re.DOTALL)
-
-        if not match:
-            return {}, content
-
-        try:
-            if yaml:
-                front_matter = yaml.safe_load(match.group(1))
-            else:
-                # yamlがない場合は簡易パース
-                front_matter = {}
-                for line in match.group(1).split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        front_matter[key.strip()] = value.strip().strip('"\'')
-        except:
-            front_matter = {}
-
-        body = match.group(2).strip()
-        return front_matter, body
-
-    def markdown_to_html(self, markdown_text: str) -> str:
-        """簡易Markdown→HTML変換"""
-        html = markdown_text
-
-        # コードブロック（先に処理）
-        html = re.sub(r'```(.+?)\n(.*?)```', r'<pre><code>\2</code></pre>', html, flags=re.DOTALL)
-
-        # 見出し
-        html = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-        html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-        html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-
-        # テーブル（簡易対応）
-        lines = html.split('\n')
-        in_table = False
-        table_lines = []
-        result_lines = []
-
-        for line in lines:
-            if '|' in line and not line.strip().startswith('<'):
-                if not in_table:
-                    in_table = True
-                    table_lines = []
-                table_lines.append(line)
-            else:
-                if in_table and table_lines:
-                    result_lines.append(self.convert_table(table_lines))
-                    table_lines = []
-                    in_table = False
-                result_lines.append(line)
-
-        if table_lines:
-            result_lines.append(self.convert_table(table_lines))
-
-        html = '\n'.join(result_lines)
-
-        # リスト
-        html = re.sub(r'^\d+\. (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'^[\-\*] (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'(<li>.*?</li>\n?)+', r'<ul>\g<0></ul>', html, flags=re.DOTALL)
-
-        # 太字
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-
-        # 斜体
-        html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
-
-        # リンク
-        html = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', html)
-
-        # 画像
-        html = re.sub(r'!\[(.+?)\]\((.+?)\)', r'<img src="\2" alt="\1" loading="lazy" />', html)
-
-        # 段落
-        paragraphs = []
-        current_para = []
-
-        for line in html.split('\n'):
-            line = line.strip()
-            if not line:
-                if current_para:
-                    paragraphs.append('<p>' + ' '.join(current_para) + '</p>')
-                    current_para = []
-            elif line.startswith('<'):
-                if current_para:
-                    paragraphs.append('<p>' + ' '.join(current_para) + '</p>')
-                    current_para = []
-                paragraphs.append(line)
-            else:
-                current_para.append(line)
-
-        if current_para:
-            paragraphs.append('<p>' + ' '.join(current_para) + '</p>')
-
-        return '\n'.join(paragraphs)
-
-    def convert_table(self, lines: List[str]) -> str:
-        """Markdownテーブルを HTMLに変換"""
-        if len(lines) < 2:
-            return '\n'.join(lines)
-
-        html = '<table>'
-
-        # ヘッダー
-        header = lines[0].strip('|').split('|')
-        html += '<thead><tr>'
-        for cell in header:
-            html += f'<th>{cell.strip()}</th>'
-        html += '</tr></thead>'
-
-        # ボディ（区切り行をスキップ）
-        html += '<tbody>'
-        for line in lines[2:]:
-            cells = line.strip('|').split('|')
-            html += '<tr>'
-            for cell in cells:
-                html += f'<td>{cell.strip()}</td>'
-            html += '</tr>'
-        html += '</tbody>'
-
-        html += '</table>'
-        return html
-
-    def generate_index_html(self, drafts: List[Dict], posts: List[Dict]) -> str:
-        """記事一覧HTMLを生成"""
-        html = """<!DOCTYPE html>
+try:
+    import mistune
+except ImportError:
+    mistune = None
+
+# 簡易Markdown変換 (python scripts/build_md_fast.py でCythonによりコンパイルできる)
+from _md_fast import convert_table as _convert_table, md_to_html as _md_to_html
+
+# Front matterと本文を分離するパターン
+_FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+
+# 記事一覧用にfront matterを探すファイル先頭の文字数
+_FRONT_MATTER_READ_SIZE = 8192
+
+# front matterの値をHTMLに埋め込む際のエスケープ表 (str.translateで1回の走査で置換)
+_HTML_ESC = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
+# 配信を許可するディレクトリ (.envなどプロジェクト直下のファイルは配信しない)
+_STATIC_DIRS = ('assets',)
+_ARTICLE_DIRS = ('_drafts', '_posts')
+
+# 静的ファイルのMIMEタイプ
+_MIME_TYPES = {
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.svg': 'image/svg+xml',
+    '.webp': 'image/webp',
+}
+
+# HTMLをgzip圧縮する際の圧縮レベル (1: 最速でも十分小さくなる)
+_GZIP_LEVEL = 1
+
+# 静的ファイルをコピーする際のバッファサイズ
+_COPY_BUFFER_SIZE = 64 * 1024
+
+# mistuneがあれば1パスのパーサーで変換する (ない場合は_md_fastの正規表現で簡易変換)
+_MARKDOWN = mistune.create_markdown(escape=False, plugins=['table', 'strikethrough']) if mistune else None
+
+# 記事一覧ページの固定部分 (CSSを含む前半と閉じタグ) はimport時に1回だけエンコード
+_INDEX_PRELUDE = """<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
@@ -394,112 +196,39 @@ class PreviewHandler(http.server.SimpleHTTPRequestHandler):
             <h1>📝 記事プレビューサーバー</h1>
             <p class="subtitle">マッチングアプリアフィリエイト記事管理</p>
             <div class="server-info">
-                🌐 サーバー起動中: <strong>http://localhost:{PORT}</strong><br>
-                終了するには: <code>Ctrl+C</code>
-            </div>
-        </header>
-
-        <section class="section">
-            <h2>📂 下書き ({len(drafts)}件)</h2>
-"""
-
-        if drafts:
-            html += '<ul class="article-list">'
-            for article in drafts:
-                categories_html = ''.join([f'<span class="category">{cat}</span>' for cat in article.get('categories', [])])
-                html += f"""
-                <li class="article-item">
-                    <a href="/preview/?file={article['path']}" class="article-link">
-                        <div class="article-title">{article['title']}</div>
-                        <div class="article-meta">
-                            {categories_html}
-                            {article.get('date', '')}
-                        </div>
-                        <div class="article-filename">{article['name']}</div>
-                    </a>
-                </li>
-                """
-            html += '</ul>'
-        else:
-            html += '<div class="empty-message">下書きはありません</div>'
-
-        html += """
-        </section>
-
-        <section class="section">
-            <h2>📄 公開済み ({len(posts)}件)</h2>
 """
-
-        if posts:
-            html += '<ul class="article-list">'
-            for article in posts:
-                categories_html = ''.join([f'<span class="category">{cat}</span>' for cat in article.get('categories', [])])
-                html += f"""
-                <li class="article-item">
-                    <a href="/preview/?file={article['path']}" class="article-link">
-                        <div class="article-title">{article['title']}</div>
-                        <div class="article-meta">
-                            {categories_html}
-                            {article.get('date', '')}
-                        </div>
-                        <div class="article-filename">{article['name']}</div>
-                    </a>
-                </li>
-                """
-            html += '</ul>'
-        else:
-            html += '<div class="empty-message">公開済み記事はありません</div>'
-
-        html += """
+_INDEX_TAIL = """
         </section>
     </div>
 </body>
 </html>
 """
-        return html.replace('{PORT}', str(self.server.server_port))
-
-    def generate_article_html(self, front_matter: Dict, body_html: str, file_path: str) -> str:
-        """記事HTMLを生成"""
-        title = front_matter.get('title', '記事プレビュー')
-        description = front_matter.get('description', '')
-        date = front_matter.get('date', '')
-        categories = front_matter.get('categories', [])
-        tags = front_matter.get('tags', [])
-
-        # CSSを読み込む
-        css_path = self.project_root / 'assets' / 'css' / 'main.css'
-        custom_css = ""
-        if css_path.exists():
-            try:
-                with open(css_path, 'r', encoding='utf-8') as f:
-                    custom_css = f.read()
-            except:
-                pass
+_INDEX_PRELUDE_BYTES = _INDEX_PRELUDE.encode('utf-8')
+_INDEX_TAIL_BYTES = _INDEX_TAIL.encode('utf-8')
 
-        html = f"""<!DOCTYPE html>
+# 記事ページの固定部分 (import時に1回だけエンコード)
+_ARTICLE_HEAD = """<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <meta name="description" content="{description}">
-    <style>
-        {custom_css if custom_css else '''
-        :root {{
+    <title>"""
+_ARTICLE_DEFAULT_CSS = """
+        :root {
             --primary-color: #3498db;
             --text-color: #333;
             --text-light: #666;
             --bg-light: #f8f9fa;
-        }}
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
+        }
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
             font-family: 'Noto Sans JP', -apple-system, sans-serif;
             line-height: 1.8;
             color: var(--text-color);
             background-color: var(--bg-light);
             padding: 20px;
-        }}
-        .preview-bar {{
+        }
+        .preview-bar {
             background: #fff3cd;
             border: 1px solid #ffc107;
             color: #856404;
@@ -507,40 +236,40 @@ class PreviewHandler(http.server.SimpleHTTPRequestHandler):
             border-radius: 4px;
             margin-bottom: 2rem;
             text-align: center;
-        }}
-        .preview-bar a {{
+        }
+        .preview-bar a {
             color: #856404;
             font-weight: bold;
             text-decoration: underline;
             margin-left: 1rem;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 800px;
             margin: 0 auto;
             background: white;
             padding: 40px;
             border-radius: 8px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .post-meta {{
+        }
+        .post-meta {
             color: var(--text-light);
             font-size: 0.9rem;
             margin-bottom: 1rem;
-        }}
-        .post-title {{
+        }
+        .post-title {
             font-size: 2rem;
             font-weight: 700;
             margin-bottom: 1rem;
             line-height: 1.4;
-        }}
-        .post-description {{
+        }
+        .post-description {
             font-size: 1.1rem;
             color: var(--text-light);
             margin-bottom: 2rem;
             padding-bottom: 2rem;
             border-bottom: 2px solid var(--bg-light);
-        }}
-        .category-link {{
+        }
+        .category-link {
             display: inline-block;
             background-color: var(--primary-color);
             color: white;
@@ -549,66 +278,66 @@ class PreviewHandler(http.server.SimpleHTTPRequestHandler):
             text-decoration: none;
             font-size: 0.85rem;
             margin-right: 0.5rem;
-        }}
-        .post-content {{ font-size: 1rem; }}
-        .post-content h2 {{
+        }
+        .post-content { font-size: 1rem; }
+        .post-content h2 {
             font-size: 1.75rem;
             font-weight: 700;
             margin: 2rem 0 1rem;
             padding-bottom: 0.5rem;
             border-bottom: 3px solid var(--primary-color);
-        }}
-        .post-content h3 {{
+        }
+        .post-content h3 {
             font-size: 1.4rem;
             font-weight: 600;
             margin: 1.5rem 0 1rem;
-        }}
-        .post-content h4 {{
+        }
+        .post-content h4 {
             font-size: 1.2rem;
             font-weight: 600;
             margin: 1rem 0 0.5rem;
-        }}
-        .post-content p {{ margin-bottom: 1rem; }}
-        .post-content ul {{ margin-bottom: 1rem; padding-left: 2rem; }}
-        .post-content li {{ margin-bottom: 0.5rem; }}
-        .post-content a {{ color: var(--primary-color); text-decoration: underline; }}
-        .post-content img {{
+        }
+        .post-content p { margin-bottom: 1rem; }
+        .post-content ul { margin-bottom: 1rem; padding-left: 2rem; }
+        .post-content li { margin-bottom: 0.5rem; }
+        .post-content a { color: var(--primary-color); text-decoration: underline; }
+        .post-content img {
             max-width: 100%;
             height: auto;
             border-radius: 8px;
             margin: 1rem 0;
-        }}
-        .post-content table {{
+        }
+        .post-content table {
             width: 100%;
             border-collapse: collapse;
             margin: 1rem 0;
-        }}
-        .post-content th, .post-content td {{
+        }
+        .post-content th, .post-content td {
             border: 1px solid #ddd;
             padding: 0.75rem;
             text-align: left;
-        }}
-        .post-content th {{
+        }
+        .post-content th {
             background: var(--bg-light);
             font-weight: 600;
-        }}
-        .post-content pre {{
+        }
+        .post-content pre {
             background: var(--bg-light);
             padding: 1rem;
             border-radius: 4px;
             overflow-x: auto;
             margin: 1rem 0;
-        }}
-        .post-content code {{
+        }
+        .post-content code {
             font-family: 'Courier New', monospace;
             font-size: 0.9em;
-        }}
-        .post-tags {{
+        }
+        .post-tags {
             margin-top: 2rem;
             padding-top: 2rem;
             border-top: 1px solid #e0e0e0;
-        }}
-        .tag {{
+        }
+        .tag {
             display: inline-block;
             background-color: var(--bg-light);
             padding: 0.4rem 0.8rem;
@@ -617,8 +346,9 @@ class PreviewHandler(http.server.SimpleHTTPRequestHandler):
             font-size: 0.9rem;
             margin-right: 0.5rem;
             color: var(--text-color);
-        }}
-        '''}
+        }
+        """
+_ARTICLE_BODY_OPEN = """
     </style>
 </head>
 <body>
@@ -630,31 +360,531 @@ class PreviewHandler(http.server.SimpleHTTPRequestHandler):
         <article class="post">
             <header class="post-header">
                 <div class="post-meta">
-                    <time>{date}</time>
+                    <time>"""
+_ARTICLE_TAIL = """
+        </article>
+    </div>
+</body>
+</html>"""
+_ARTICLE_HEAD_BYTES = _ARTICLE_HEAD.encode('utf-8')
+_ARTICLE_BODY_OPEN_BYTES = _ARTICLE_BODY_OPEN.encode('utf-8')
+_ARTICLE_TAIL_BYTES = _ARTICLE_TAIL.encode('utf-8')
+
+
+class PreviewHandler(http.server.SimpleHTTPRequestHandler):
+    """カスタムHTTPリクエストハンドラー"""
+
+    # ディレクトリごとの (更新時刻, ファイル名一覧)
+    _dir_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+    # 小さな書き込みをまとめて送信する (既定の0では書き込みごとに送信される)
+    wbufsize = _COPY_BUFFER_SIZE
+
+    def __init__(self, *args, project_root=None, root_str=None, article_css_bytes=b'',
+                 article_etag_salt='', **kwargs):
+        self.project_root = project_root or Path.cwd()
+        # リクエストごとにPathを組み立てないよう文字列の実パスも保持
+        self.root_str = root_str or os.path.realpath(self.project_root)
+        self.article_css_bytes = article_css_bytes
+        self.article_etag_salt = article_etag_salt
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        """GETリクエストの処理"""
+        parsed_path = urlparse(self.path)
+        path = parsed_path.path
+
+        if path == '/' or path == '/index.html':
+            # 記事一覧ページ
+            self.serve_index()
+        elif path.startswith('/preview/'):
+            # 記事プレビュー
+            file_param = parse_qs(parsed_path.query).get('file', [None])[0]
+            if file_param:
+                self.serve_article_preview(file_param)
+            else:
+                self.send_error(400, "Missing file parameter")
+        elif path.startswith('/assets/'):
+            # 静的ファイル
+            self.serve_static_file(path)
+        else:
+            self.send_error(404, "File not found")
+
+    def serve_index(self):
+        """記事一覧ページを表示"""
+        drafts = self.get_markdown_files('_drafts')
+        posts = self.get_markdown_files('_posts')
+
+        middle = self.generate_index_html(drafts, posts)
+
+        self.send_html([_INDEX_PRELUDE_BYTES, middle.encode('utf-8'), _INDEX_TAIL_BYTES])
+
+    def serve_article_preview(self, file_path: str):
+        """記事プレビューページを表示"""
+        full_path = self.resolve_path(file_path, _ARTICLE_DIRS)
+        if full_path is None or not full_path.endswith('.md'):
+            self.send_error(403, "Forbidden")
+            return
+
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            self.send_error(404, f"File not found: {file_path}")
+            return
+
+        # 記事ページにはCSSと変換結果も含まれるため、それらが変わった再起動後は別のETagにする
+        etag = _make_etag(st, self.article_etag_salt)
+        if self.send_not_modified(etag):
+            return
+
+        try:
+            front_matter, body_html = _render_article(full_path, st.st_mtime_ns)
+
+            # 本文を含む1つの巨大な文字列を作らず、部分ごとのバイト列のまま書き出す
+            chunks = self.build_article_html(front_matter, body_html)
+        except Exception as e:
+            self.send_error(500, f"Error processing file: {e}")
+            return
+
+        self.send_html(chunks, etag)
+
+    def serve_static_file(self, path: str):
+        """静的ファイルを提供"""
+        file_path = self.resolve_path(path.lstrip('/'), _STATIC_DIRS)
+        if file_path is None:
+            self.send_error(403, "Forbidden")
+            return
+
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            self.send_error(404, "File not found")
+            return
+
+        etag = _make_etag(st)
+        if self.send_not_modified(etag):
+            return
+
+        # MIMEタイプを推測 (よく使う拡張子は表から、それ以外はmimetypesで)
+        ext = os.path.splitext(path)[1].lower()
+        content_type = _MIME_TYPES.get(ext) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+        try:
+            with open(file_path, 'rb', buffering=0) as f:
+                self.send_response(200)
+                self.send_header('Content-type', content_type)
+                self.send_header('Content-Length', str(st.st_size))
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                _send_file(f, self.wfile, st.st_size)
+
+        except Exception as e:
+            self.send_error(500, f"Error reading file: {e}")
+
+    def resolve_path(self, relative_path: str, allowed_dirs: Tuple[str, ...]) -> Optional[str]:
+        """
+        リクエストされたパスを許可されたディレクトリ内の実パスに変換
+
+        Args:
+            relative_path: プロジェクトルートからの相対パス
+            allowed_dirs: 配信を許可するディレクトリ (プロジェクトルートからの相対パス)
+
+        Returns:
+            実パス、許可されたディレクトリの外を指す場合 (../や絶対パス) はNone
+        """
+        target = os.path.realpath(os.path.join(self.root_str, relative_path))
+        prefixes = tuple(os.path.join(self.root_str, d) + os.sep for d in allowed_dirs)
+        if not target.startswith(prefixes):
+            return None
+        return target
+
+    def send_html(self, chunks: Iterable[bytes], etag: Optional[str] = None) -> None:
+        """
+        HTMLレスポンスを送信 (ブラウザが対応していればgzip圧縮する)
+
+        Args:
+            chunks: HTMLを分割したバイト列
+            etag: ETag (キャッシュ検証しない場合はNone)
+        """
+        use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+
+        if not use_gzip:
+            for chunk in chunks:
+                self.wfile.write(chunk)
+            return
+
+        # 部分ごとに圧縮しながら送信する (wbits=31でgzip形式)
+        compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            self.wfile.write(compressor.compress(chunk))
+        self.wfile.write(compressor.flush())
+
+    def send_not_modified(self, etag: str) -> bool:
+        """ブラウザのキャッシュが最新(If-None-Matchが一致)なら304を返す"""
+        if self.headers.get('If-None-Match') != etag:
+            return False
+
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        return True
+
+    def get_markdown_files(self, directory: str) -> List[Dict]:
+        """Markdownファイル一覧を取得"""
+        dir_path = self.project_root / directory
+
+        try:
+            dir_mtime_ns = dir_path.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        # ファイル名の一覧はディレクトリの更新時刻が変わるまで使い回す
+        cache_key = str(dir_path)
+        cached = self._dir_cache.get(cache_key)
+        if cached and cached[0] == dir_mtime_ns:
+            names = cached[1]
+        else:
+            names = sorted((p.name for p in dir_path.glob('*.md')), reverse=True)
+            self._dir_cache[cache_key] = (dir_mtime_ns, names)
+
+        files = []
+        for name in names:
+            file_path = dir_path / name
+            try:
+                entry = _read_listing_entry(str(file_path), file_path.stat().st_mtime_ns)
+            except Exception:
+                # パースエラーは無視
+                continue
+
+            files.append({'path': f'{directory}/{name}', 'name': name, **entry})
+
+        return files
+
+    @staticmethod
+    def parse_markdown_file(file_path: Path) -> Tuple[Dict, str]:
+        """Markdownファイルをパース"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        return PreviewHandler.parse_markdown_text(content)
+
+    @staticmethod
+    def parse_markdown_text(content: str) -> Tuple[Dict, str]:
+        """Markdownテキストをfront matterと本文に分けてパース"""
+        # Front matterと本文を分離
+        match = _FRONT_MATTER_RE.match(content)
+
+        if not match:
+            return {}, content
+
+        try:
+            if yaml:
+                front_matter = yaml.load(match.group(1), Loader=_YAML_LOADER)
+            else:
+                # yamlがない場合は簡易パース
+                front_matter = {}
+                for line in match.group(1).split('\n'):
+                    if ':' in line:
+                        key, value = line.split(':', 1)
+                        front_matter[key.strip()] = value.strip().strip('"\'')
+        except:
+            front_matter = {}
+
+        body = match.group(2).strip()
+        return front_matter, body
+
+    @staticmethod
+    def markdown_to_html(markdown_text: str) -> str:
+        """簡易Markdown→HTML変換"""
+        if _MARKDOWN is not None:
+            return _MARKDOWN(markdown_text)
+
+        return _md_to_html(markdown_text)
+
+    @staticmethod
+    def convert_table(lines: List[str]) -> str:
+        """Markdownテーブルを HTMLに変換"""
+        return _convert_table(lines)
+
+    def generate_index_html(self, drafts: List[Dict], posts: List[Dict]) -> str:
+        """記事一覧HTMLの可変部分 (サーバー情報と記事リスト) を生成"""
+        port = self.server.server_port
+        parts = [f"""                🌐 サーバー起動中: <strong>http://localhost:{port}</strong><br>
+                終了するには: <code>Ctrl+C</code>
+            </div>
+        </header>
+
+        <section class="section">
+            <h2>📂 下書き ({len(drafts)}件)</h2>
+"""]
+        self.append_article_list(parts, drafts, '下書きはありません')
+
+        parts.append(f"""
+        </section>
+
+        <section class="section">
+            <h2>📄 公開済み ({len(posts)}件)</h2>
+""")
+        self.append_article_list(parts, posts, '公開済み記事はありません')
+
+        return ''.join(parts)
+
+    def append_article_list(self, parts: List[str], articles: List[Dict], empty_message: str) -> None:
+        """記事リストのHTML断片をpartsに追加"""
+        if not articles:
+            parts.append(f'<div class="empty-message">{empty_message}</div>')
+            return
+
+        parts.append('<ul class="article-list">')
+        for article in articles:
+            categories_html = ''.join([f'<span class="category">{_esc(cat)}</span>' for cat in article.get('categories', [])])
+            parts.append(f"""
+                <li class="article-item">
+                    <a href="/preview/?file={quote(article['path'])}" class="article-link">
+                        <div class="article-title">{_esc(article['title'])}</div>
+                        <div class="article-meta">
+                            {categories_html}
+                            {_esc(article.get('date', ''))}
+                        </div>
+                        <div class="article-filename">{_esc(article['name'])}</div>
+                    </a>
+                </li>
+                """)
+        parts.append('</ul>')
+
+    def build_article_html(self, front_matter: Dict, body_html: str) -> List[bytes]:
+        """
+        記事HTMLを部分ごとのバイト列として作成 (固定部分はエンコード済みのバイト列をそのまま使う)
+
+        ヘッダー送信後にエラーにならないよう、レスポンスを送る前にすべて作成する。
+
+        Args:
+            front_matter: front matter辞書
+            body_html: 本文HTML
+
+        Returns:
+            HTMLを分割したバイト列のリスト
+        """
+        title = _esc(front_matter.get('title', '記事プレビュー'))
+        description = _esc(front_matter.get('description', ''))
+        date = _esc(front_matter.get('date', ''))
+        categories = front_matter.get('categories') or []
+        tags = front_matter.get('tags') or []
+
+        categories_html = ''.join([f'<span class="category-link">{_esc(cat)}</span>' for cat in categories])
+        tags_html = ''.join([f'<span class="tag">#{_esc(tag)}</span>' for tag in tags])
+
+        return [
+            _ARTICLE_HEAD_BYTES,
+            f"""{title}</title>
+    <meta name="description" content="{description}">
+    <style>
+        """.encode('utf-8'),
+            self.article_css_bytes,
+            _ARTICLE_BODY_OPEN_BYTES,
+            f"""{date}</time>
                     {' • ' if categories else ''}
-                    {''.join([f'<span class="category-link">{cat}</span>' for cat in categories])}
+                    {categories_html}
                 </div>
                 <h1 class="post-title">{title}</h1>
                 <p class="post-description">{description}</p>
             </header>
             <div class="post-content">
-                {body_html}
+                """.encode('utf-8'),
+            body_html.encode('utf-8'),
+            f"""
             </div>
             {f'''<footer class="post-tags">
                 <strong>タグ:</strong>
-                {''.join([f'<span class="tag">#{tag}</span>' for tag in tags])}
-            </footer>''' if tags else ''}
-        </article>
-    </div>
-</body>
-</html>"""
-        return html
+                {tags_html}
+            </footer>''' if tags else ''}""".encode('utf-8'),
+            _ARTICLE_TAIL_BYTES,
+        ]
+
+
+def _esc(value) -> str:
+    """front matterの値をHTMLエスケープ (日付などの文字列以外はstrに変換)"""
+    if not isinstance(value, str):
+        value = str(value)
+    return value.translate(_HTML_ESC)
+
+
+def _make_etag(st: os.stat_result, salt: str = '') -> str:
+    """
+    ファイルの更新時刻とサイズからETagを作成
+
+    Args:
+        st: ファイルのstat結果
+        salt: ファイル以外に応答内容を左右するものを表す文字列 (記事ページのCSSや変換方式)
+
+    Returns:
+        ETag (引用符付き)
+    """
+    return f'"{salt}{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _send_file(f, wfile, size: int) -> None:
+    """
+    ファイルの内容をレスポンスとして送信
+
+    os.sendfileでページキャッシュから直接ソケットへ送り、
+    使えない環境では64KiBずつコピーする。
+
+    Args:
+        f: 送信するファイル (バイナリモード)
+        wfile: レスポンスの書き込み先
+        size: ファイルサイズ
+    """
+    # バッファに残っているレスポンスヘッダーを先に送る
+    wfile.flush()
+
+    offset = 0
+    try:
+        out_fd = wfile.fileno()
+        while offset < size:
+            sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+        return
+    except (AttributeError, OSError) as e:
+        # 送信途中の失敗や切断はフォールバックしない
+        if offset or isinstance(e, ConnectionError):
+            raise
+
+    # 64KiBのバッファを使い回して少しずつ書き出す (ファイル全体をメモリに載せない)
+    buf = bytearray(_COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        wfile.write(view[:n])
+
+
+def _read_front_matter_text(file_path: Path) -> str:
+    """
+    front matterを含むファイルの先頭部分を読み込む
+
+    front matterが先頭の数KBに収まっていれば本文は読まない。
+    収まらない場合はファイル全体を読む。
+
+    Args:
+        file_path: Markdownファイルのパス
+
+    Returns:
+        ファイルの先頭部分 (またはファイル全体) の文字列
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        head = f.read(_FRONT_MATTER_READ_SIZE)
+        if len(head) == _FRONT_MATTER_READ_SIZE and not _FRONT_MATTER_RE.match(head):
+            head += f.read()
+    return head
+
+
+@functools.lru_cache(maxsize=256)
+def _read_listing_entry(full_path_str: str, mtime_ns: int) -> Dict:
+    """
+    記事一覧に表示する情報を取得 (mtime_nsが変わるまで結果を使い回す)
+
+    Args:
+        full_path_str: Markdownファイルのパス
+        mtime_ns: ファイルの更新時刻 (キャッシュキー)
+
+    Returns:
+        タイトル・日付・カテゴリーの辞書
+    """
+    file_path = Path(full_path_str)
+    front_matter, _ = PreviewHandler.parse_markdown_text(_read_front_matter_text(file_path))
+    return {
+        'title': front_matter.get('title', file_path.stem),
+        'date': front_matter.get('date', ''),
+        'categories': front_matter.get('categories', []),
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _render_article(full_path_str: str, mtime_ns: int) -> Tuple[Dict, str]:
+    """
+    記事をパースして本文をHTMLに変換 (mtime_nsが変わるまで結果を使い回す)
+
+    Args:
+        full_path_str: Markdownファイルのパス
+        mtime_ns: ファイルの更新時刻 (キャッシュキー)
+
+    Returns:
+        (front_matter辞書, 本文HTML)
+    """
+    front_matter, body = PreviewHandler.parse_markdown_file(Path(full_path_str))
+    # 空のfront matter (---の間に何もない) はNoneになる
+    return front_matter or {}, PreviewHandler.markdown_to_html(body)
+
+
+class PreviewServer(socketserver.ThreadingTCPServer):
+    """リクエストごとにスレッドで処理するサーバー (画像やCSSを並行して返す)"""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def server_bind(self):
+        """ソケットをバインドし、記事一覧に表示するポート番号を保持"""
+        super().server_bind()
+        self.server_port = self.server_address[1]
+
+
+def load_custom_css(project_root: Path) -> str:
+    """サイトのCSSを読み込む (読めない場合は空文字列)"""
+    css_path = project_root / 'assets' / 'css' / 'main.css'
+    try:
+        return css_path.read_text(encoding='utf-8')
+    except Exception:
+        return ''
+
+
+def _article_etag_salt(article_css_bytes: bytes) -> str:
+    """
+    記事ページのETagに混ぜる文字列を作成 (CSSとMarkdownの変換方式から求める)
+
+    Args:
+        article_css_bytes: 記事ページに埋め込むCSS
+
+    Returns:
+        ETagの先頭に付ける文字列
+    """
+    renderer = f"mistune-{getattr(mistune, '__version__', '')}" if mistune else '_md_fast'
+    return f'{zlib.crc32(renderer.encode("utf-8"), zlib.crc32(article_css_bytes)):08x}-'
 
 
 def create_handler(project_root):
     """ハンドラーファクトリー"""
+    # CSSはリクエストごとに読まず、サーバー起動時に1回だけ読み込んでエンコードしておく
+    custom_css = load_custom_css(project_root)
+    article_css_bytes = (custom_css or _ARTICLE_DEFAULT_CSS).encode('utf-8')
+    article_etag_salt = _article_etag_salt(article_css_bytes)
+
+    root_str = os.path.realpath(project_root)
+
     def handler(*args, **kwargs):
-        PreviewHandler(*args, project_root=project_root, **kwargs)
+        PreviewHandler(
+            *args,
+            project_root=project_root,
+            root_str=root_str,
+            article_css_bytes=article_css_bytes,
+            article_etag_salt=article_etag_salt,
+            **kwargs
+        )
     return handler
 
 
@@ -664,8 +894,7 @@ def start_server(port: int, project_root: Path, open_browser: bool = True) -> No
 
     handler = create_handler(project_root)
 
-    with socketserver.TCPServer(("", port), handler) as httpd:
-        httpd.allow_reuse_address = True
+    with PreviewServer(("", port), handler) as httpd:
         url = f"http://localhost:{port}"
 
         print("\n" + "=" * 60)